@@ -14,7 +14,7 @@ sys.path.insert(0, str(project_root))
 from google.cloud import firestore
 from src.features.storage.clients.firestore_client import FirestoreClient
 from src.features.storage.repositories.shop_repository import ShopRepository
-from src.infrastructure.config.settings import Settings
+from src.infrastructure.config.settings import get_settings
 
 
 def parse_args():
@@ -31,7 +31,7 @@ def parse_args():
 
 def main():
     args = parse_args()
-    settings = Settings()
+    settings = get_settings()
 
     # Firestoreエミュレータの設定を環境変数に反映
     if settings.firestore_emulator_host:
@@ -8,12 +8,12 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from src.infrastructure.config.settings import Settings
+from src.infrastructure.config.settings import get_settings
 from src.features.storage.clients.firestore_client import FirestoreClient
 from src.features.storage.repositories.shop_repository import ShopRepository
 
 # 設定を読み込み
-settings = Settings()
+settings = get_settings()
 
 # Firestoreエミュレータの設定を環境変数に反映
 if settings.firestore_emulator_host:
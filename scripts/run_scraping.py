@@ -9,7 +9,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.features.batch.orchestrator import BatchOrchestrator
-from src.infrastructure.config.settings import Settings
+from src.infrastructure.config.settings import get_settings
 from src.shared.logging.config import setup_logging, get_logger
 
 
@@ -35,7 +35,7 @@ def main():
     args = parser.parse_args()
 
     # 設定を読み込み
-    settings = Settings()
+    settings = get_settings()
 
     # Firestoreエミュレータの設定を環境変数に反映
     if settings.firestore_emulator_host:
@@ -57,6 +57,8 @@ class PrefectureScrapingJob:
 
         # 進捗管理
         self.completed_pages: list[int] = []
+        self._progress_initialized = False  # 進捗ドキュメントを初期化済みか
+        self._progress_shops_saved = 0  # 進捗ドキュメントに反映済みの店舗数
 
         logger.info(
             f"PrefectureScrapingJob initialized: {self.scraper.prefecture_name} (batch_size={batch_size})"
@@ -105,6 +107,8 @@ class PrefectureScrapingJob:
                     resume_from_page = max(completed_pages) + 1
                     self.completed_pages = completed_pages
                     self.total_processed = previous_progress.get("total_shops_saved", 0)
+                    self._progress_initialized = True
+                    self._progress_shops_saved = self.total_processed
                     logger.info(
                         f"Resuming from page {resume_from_page}, "
                         f"{len(completed_pages)} pages already completed, "
@@ -148,14 +152,24 @@ class PrefectureScrapingJob:
             def on_page_complete(page_num: int) -> None:
                 """ページ完了時の処理"""
                 self.completed_pages.append(page_num)
-                # 進捗を保存
+                # 進捗を保存（初回は全体を書き込み、以降は差分のみ）
                 last_shop_id = f"{self.scraper.prefecture_code}_{self.total_processed:05d}"
-                self.progress_repository.save_progress(
-                    prefecture_code=self.scraper.prefecture_code,
-                    completed_pages=self.completed_pages,
-                    total_shops_saved=self.total_processed,
-                    last_shop_id=last_shop_id,
-                )
+                if self._progress_initialized:
+                    self.progress_repository.mark_page_complete(
+                        prefecture_code=self.scraper.prefecture_code,
+                        completed_pages=self.completed_pages,
+                        shops_added=self.total_processed - self._progress_shops_saved,
+                        last_shop_id=last_shop_id,
+                    )
+                else:
+                    self.progress_repository.save_progress(
+                        prefecture_code=self.scraper.prefecture_code,
+                        completed_pages=self.completed_pages,
+                        total_shops_saved=self.total_processed,
+                        last_shop_id=last_shop_id,
+                    )
+                    self._progress_initialized = True
+                self._progress_shops_saved = self.total_processed
                 logger.info(f"Page {page_num} completed and progress saved")
 
             # スクレイピング実行（バッチコールバック付き）
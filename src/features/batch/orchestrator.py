@@ -6,6 +6,7 @@ from ...infrastructure.config.settings import Settings
 from ...infrastructure.gcp.secret_manager import SecretManagerClient
 from ...shared.http.client import HTTPClient
 from ...shared.logging.config import get_logger
+from ...shared.utils.datetime_utils import freeze_time
 from ..geocoding.services.geocoding_service import GeocodingService
 from ..notifications.providers.slack_notifier import SlackNotifier
 from ..scraping.scrapers.prefectures.aichi import AichiScraper
@@ -29,13 +30,21 @@ class BatchOrchestrator:
     各Featureを統合し、依存性注入を行う
     """
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, http_client: Optional[HTTPClient] = None) -> None:
         """
         Args:
             settings: アプリケーション設定
+            http_client: 共有HTTPクライアント（Noneの場合は設定から新規作成）
         """
         self.settings = settings
 
+        # HTTPクライアント（全スクレイパーで1つのセッションを共有）
+        self.http_client = http_client or HTTPClient(
+            timeout=settings.scraping_timeout,
+            max_retries=settings.scraping_retry,
+            user_agent=settings.scraping_user_agent,
+        )
+
         # Secret Managerクライアントを初期化
         self.secret_manager: Optional[SecretManagerClient] = None
         if not settings.is_development:
@@ -45,6 +54,7 @@ class BatchOrchestrator:
         self.firestore_client = FirestoreClient(
             project_id=settings.gcp_project_id,
             database_id=settings.firestore_database_id,
+            pool_size=settings.firestore_client_pool_size,
         )
 
         # リポジトリを初期化
@@ -52,11 +62,8 @@ class BatchOrchestrator:
         self.history_repository = HistoryRepository(self.firestore_client)
         self.progress_repository = ProgressRepository(self.firestore_client)
 
-        # ジオコーディングサービスを初期化（任意）
-        self.geocoding_service = self._create_geocoding_service()
-
-        # Slack通知プロバイダーを初期化
-        self.slack_notifier = self._create_slack_notifier()
+        # シークレットに依存するサービスを初期化（ジョブごとに再作成する）
+        self._refresh_secret_dependencies()
 
         logger.info("BatchOrchestrator initialized")
 
@@ -64,15 +71,8 @@ class BatchOrchestrator:
         """茨城県のスクレイピングジョブを実行"""
         logger.info("Starting Ibaraki scraping job")
 
-        # HTTPクライアントを作成
-        http_client = HTTPClient(
-            timeout=self.settings.scraping_timeout,
-            max_retries=self.settings.scraping_retry,
-            user_agent=self.settings.scraping_user_agent,
-        )
-
         # スクレイパーを作成
-        scraper = IbarakiScraper(http_client=http_client)
+        scraper = IbarakiScraper(http_client=self.http_client)
 
         # ジョブを実行
         job = PrefectureScrapingJob(
@@ -92,15 +92,8 @@ class BatchOrchestrator:
         """東京都のスクレイピングジョブを実行"""
         logger.info("Starting Tokyo scraping job")
 
-        # HTTPクライアントを作成
-        http_client = HTTPClient(
-            timeout=self.settings.scraping_timeout,
-            max_retries=self.settings.scraping_retry,
-            user_agent=self.settings.scraping_user_agent,
-        )
-
         # スクレイパーを作成（CSV方式）
-        scraper = TokyoCsvScraper(http_client=http_client)
+        scraper = TokyoCsvScraper(http_client=self.http_client)
 
         # ジョブを実行
         job = PrefectureScrapingJob(
@@ -128,35 +121,33 @@ class BatchOrchestrator:
         """
         logger.info(f"Starting scraping job for prefecture: {prefecture_code}")
 
-        if prefecture_code == "08":
-            self.run_ibaraki_scraping()
-        elif prefecture_code == "13":
-            self.run_tokyo_scraping()
-        elif prefecture_code == "23":
-            self.run_aichi_scraping()
-        elif prefecture_code == "29":
-            self.run_nara_scraping()
-        elif prefecture_code == "27":
-            self.run_osaka_scraping()
-        else:
-            raise ValueError(
-                f"Unsupported prefecture code: {prefecture_code}. "
-                f"Currently, only Ibaraki (08), Tokyo (13), Aichi (23), and Nara (29) are supported."
-            )
+        # オーケストレーターは使い回されるため、シークレットはジョブごとに取り直す
+        self._refresh_secret_dependencies()
+
+        # 同一ジョブ内の店舗には共通のスクレイピング日時を付与
+        with freeze_time():
+            if prefecture_code == "08":
+                self.run_ibaraki_scraping()
+            elif prefecture_code == "13":
+                self.run_tokyo_scraping()
+            elif prefecture_code == "23":
+                self.run_aichi_scraping()
+            elif prefecture_code == "29":
+                self.run_nara_scraping()
+            elif prefecture_code == "27":
+                self.run_osaka_scraping()
+            else:
+                raise ValueError(
+                    f"Unsupported prefecture code: {prefecture_code}. "
+                    f"Currently, only Ibaraki (08), Tokyo (13), Aichi (23), and Nara (29) are supported."
+                )
 
     def run_nara_scraping(self) -> None:
         """奈良県のスクレイピングジョブを実行"""
         logger.info("Starting Nara scraping job")
 
-        # HTTPクライアントを作成
-        http_client = HTTPClient(
-            timeout=self.settings.scraping_timeout,
-            max_retries=self.settings.scraping_retry,
-            user_agent=self.settings.scraping_user_agent,
-        )
-
         # スクレイパーを作成
-        scraper = NaraScraper(http_client=http_client)
+        scraper = NaraScraper(http_client=self.http_client)
 
         # ジョブを実行
         job = PrefectureScrapingJob(
@@ -176,15 +167,8 @@ class BatchOrchestrator:
         """大阪府のスクレイピングジョブを実行"""
         logger.info("Starting Osaka scraping job")
 
-        # HTTPクライアントを作成
-        http_client = HTTPClient(
-            timeout=self.settings.scraping_timeout,
-            max_retries=self.settings.scraping_retry,
-            user_agent=self.settings.scraping_user_agent,
-        )
-
         # スクレイパーを作成
-        scraper = OsakaScraper(http_client=http_client)
+        scraper = OsakaScraper(http_client=self.http_client)
 
         # ジョブを実行
         job = PrefectureScrapingJob(
@@ -204,15 +188,8 @@ class BatchOrchestrator:
         """愛知県のスクレイピングジョブを実行"""
         logger.info("Starting Aichi scraping job")
 
-        # HTTPクライアントを作成
-        http_client = HTTPClient(
-            timeout=self.settings.scraping_timeout,
-            max_retries=self.settings.scraping_retry,
-            user_agent=self.settings.scraping_user_agent,
-        )
-
         # スクレイパーを作成
-        scraper = AichiScraper(http_client=http_client)
+        scraper = AichiScraper(http_client=self.http_client)
 
         # ジョブを実行
         job = PrefectureScrapingJob(
@@ -243,6 +220,16 @@ class BatchOrchestrator:
 
         logger.info("All prefecture scraping jobs completed")
 
+    def _refresh_secret_dependencies(self) -> None:
+        """
+        シークレットを使うサービス（ジオコーディング、Slack通知）を作成し直す
+
+        シークレットは SecretManagerClient のTTLキャッシュ経由で取得するため、
+        ローテーションされた値はTTL経過後に開始したジョブから反映される。
+        """
+        self.geocoding_service = self._create_geocoding_service()
+        self.slack_notifier = self._create_slack_notifier()
+
     def _create_geocoding_service(self) -> Optional[GeocodingService]:
         """
         ジオコーディングサービスを作成
@@ -3,6 +3,7 @@
 from typing import Optional
 
 from ....shared.logging.config import get_logger
+from ....shared.utils.text import WHITESPACE_RE
 from ..domain.models import GeoLocation
 from .google_maps_geocoder import GoogleMapsGeocoder
 
@@ -137,13 +138,8 @@ class CacheGeocoder:
         # 空白を除去し、小文字に変換
         normalized = address.strip().lower()
 
-        # 全角スペースを半角に変換
-        normalized = normalized.replace("　", " ")
-
-        # 連続する空白を1つに
-        import re
-
-        normalized = re.sub(r"\s+", " ", normalized)
+        # 連続する空白（全角スペースを含む）を半角スペース1つに
+        normalized = WHITESPACE_RE.sub(" ", normalized)
 
         return normalized
 
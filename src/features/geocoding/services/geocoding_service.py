@@ -7,6 +7,7 @@ from tqdm import tqdm
 
 from ....shared.exceptions.errors import GeocodingError
 from ....shared.logging.config import get_logger
+from ....shared.utils.datetime_utils import batch_now_jst
 from ...scraping.domain.models import Shop
 from ..providers.cache_geocoder import CacheGeocoder
 from ..providers.google_maps_geocoder import GoogleMapsGeocoder
@@ -65,10 +66,7 @@ class GeocodingService:
             if geo_location:
                 shop.latitude = geo_location.latitude
                 shop.longitude = geo_location.longitude
-
-                from datetime import datetime
-
-                shop.geocoded_at = datetime.now()
+                shop.geocoded_at = batch_now_jst()
 
                 logger.debug(
                     f"Geocoded shop {shop.shop_id}: {full_address} -> ({geo_location.latitude}, {geo_location.longitude})"
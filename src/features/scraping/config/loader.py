@@ -0,0 +1,30 @@
+"""都道府県設定ファイルのローダー"""
+
+from functools import lru_cache
+from typing import Any
+
+import yaml
+
+# libyamlが利用可能な場合はCローダーを使用
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=None)
+def load_prefecture_config(config_path: str) -> dict[str, Any]:
+    """
+    都道府県設定ファイル（YAML）を読み込み
+
+    同じパスの設定はプロセス内でキャッシュされるため、
+    スクレイパーを複数回生成してもパースは1回のみ。
+
+    Args:
+        config_path: 設定ファイルのパス
+
+    Returns:
+        dict[str, Any]: 設定内容
+
+    Note:
+        返り値はキャッシュされた共有オブジェクトのため、変更しないこと
+    """
+    with open(config_path, "rb") as f:
+        return yaml.load(f, Loader=_YamlLoader)
@@ -4,10 +4,11 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional
 
+from ....shared.utils.datetime_utils import batch_now_jst
 from .enums import PrefectureCode, ScrapingStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class Shop:
     """
     店舗情報（Firestore保存用）
@@ -53,8 +54,8 @@ class Shop:
     genre: Optional[str] = None  # ジャンル
 
     # メタデータ
-    scraped_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    scraped_at: datetime = field(default_factory=batch_now_jst)
+    updated_at: datetime = field(default_factory=batch_now_jst)
     is_active: bool = True
 
     # 検索用キーワード（Firestore複合インデックス用）
@@ -70,6 +71,7 @@ class Shop:
             "prefecture_code": self.prefecture_code,
             "prefecture_name": self.prefecture_name,
             "name": self.name,
+            "name_lower": self.name.lower() if self.name else None,  # 前方一致検索用
             "address": self.address,
             "phone": self.phone,
             "business_hours": self.business_hours,
@@ -115,8 +117,8 @@ class Shop:
             postal_code=data.get("postal_code"),
             category=data.get("category"),
             genre=data.get("genre"),
-            scraped_at=data.get("scraped_at", datetime.now()),
-            updated_at=data.get("updated_at", datetime.now()),
+            scraped_at=data.get("scraped_at") or batch_now_jst(),
+            updated_at=data.get("updated_at") or batch_now_jst(),
             is_active=data.get("is_active", True),
             search_terms=data.get("search_terms", []),
             extra_fields=data.get("extra_fields", {}),
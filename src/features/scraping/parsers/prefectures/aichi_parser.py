@@ -1,12 +1,12 @@
 """愛知県の店舗情報パーサー"""
 
 import re
-from datetime import datetime
 from typing import Any, Optional
 
 from bs4 import BeautifulSoup
 
 from .....shared.logging.config import get_logger
+from .....shared.utils.datetime_utils import batch_now_jst
 from .....shared.utils.text import extract_phone_number, extract_postal_code, normalize_text
 from ...domain.models import Shop
 from ..base import BaseParser
@@ -169,6 +169,7 @@ class AichiParser(BaseParser):
         postal_code = self._extract_postal_code(address)
 
         # 店舗オブジェクトを作成
+        now = batch_now_jst()
         shop = Shop(
             shop_id=shop_id,
             prefecture_code=self.prefecture_code,
@@ -200,8 +201,8 @@ class AichiParser(BaseParser):
             parking=self._extract_field(data, ["駐車場", "駐車スペース"]),
             category=self._extract_field(data, ["カテゴリ", "カテゴリー", "業種"]),
             genre=self._extract_field(data, ["ジャンル", "分類"]),
-            scraped_at=datetime.now(),
-            updated_at=datetime.now(),
+            scraped_at=now,
+            updated_at=now,
             is_active=True,
         )
 
@@ -1,9 +1,9 @@
 """奈良県の店舗情報パーサー"""
 
-from datetime import datetime
 from typing import Any, Optional
 
 from .....shared.logging.config import get_logger
+from .....shared.utils.datetime_utils import batch_now_jst
 from ...domain.models import Shop
 from ..base import BaseParser
 
@@ -72,6 +72,7 @@ class NaraParser(BaseParser):
                 postal_code = f"{postal_code[:3]}-{postal_code[3:]}"
 
             # Shop Object
+            now = batch_now_jst()
             shop = Shop(
                 shop_id=shop_id,
                 prefecture_code=self.prefecture_code,
@@ -89,8 +90,8 @@ class NaraParser(BaseParser):
                 parking=None,
                 category=data.get("StoreServiceCategory__c"),  # 例: "割引;プレゼント"
                 genre=data.get("StoreGenre__c"),  # 例: "飲食;お買い物"
-                scraped_at=datetime.now(),
-                updated_at=datetime.now(),
+                scraped_at=now,
+                updated_at=now,
                 is_active=data.get("IsPublic__c", True),
             )
 
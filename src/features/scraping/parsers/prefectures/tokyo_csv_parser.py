@@ -18,6 +18,38 @@ class TokyoCsvParser:
     CSVファイルの各行を解析して、Shopモデルに変換します。
     """
 
+    # サービス内容（○がついているもの）の列キーと表示ラベル
+    SERVICE_LABELS = {
+        "service_milk": "粉ミルクのお湯の提供",
+        "service_diaper": "おむつ替えスペースあり",
+        "service_baby_keep": "トイレにベビーキープ設置",
+        "service_nursing": "授乳スペースあり",
+        "service_kids_space": "キッズスペースあり",
+        "service_stroller": "ベビーカー入店可能",
+        "service_gift": "景品の提供",
+        "service_points": "ポイントの付与",
+        "service_discount": "商品の割引",
+    }
+
+    # parse_row で参照する列キー（_field_indices と同じ順序）
+    FIELD_KEYS = (
+        "shop_id",
+        "name",
+        "city",
+        "address1",
+        "address2",
+        "phone",
+        "website",
+        "business_hours",
+        "closed_days",
+        "parking",
+        "genre1",
+        "genre2",
+        "genre3",
+        "genre_detail",
+        "discount_detail",
+    )
+
     def __init__(self, prefecture_code: str, prefecture_name: str, column_mapping: dict):
         """
         Args:
@@ -29,6 +61,15 @@ class TokyoCsvParser:
         self.prefecture_name = prefecture_name
         self.columns = column_mapping
 
+        # 行ごとの計算を避けるため、列インデックスを事前に解決（未設定の列はNone）
+        self._max_index = max(column_mapping.values())
+        self._field_indices = tuple(column_mapping.get(key) for key in self.FIELD_KEYS)
+        self._service_indices = tuple(
+            (column_mapping[key], label)
+            for key, label in self.SERVICE_LABELS.items()
+            if key in column_mapping
+        )
+
     def parse_row(self, row: list[str]) -> Optional[Shop]:
         """
         CSV行をShopオブジェクトに変換
@@ -41,22 +82,37 @@ class TokyoCsvParser:
         """
         try:
             # 必須フィールドのチェック
-            if len(row) <= max(self.columns.values()):
+            if len(row) <= self._max_index:
                 logger.warning(f"Row has insufficient columns: {len(row)} columns")
                 return None
 
-            # 店舗名取得（必須）
-            name = self._get_value(row, "name")
-            if not name or name.strip() == "":
+            # 列の値を一括取得（前後の空白を除去し、空文字はNone）
+            (
+                shop_id_str,
+                name,
+                city,
+                address1,
+                address2,
+                phone,
+                website,
+                business_hours,
+                closed_days,
+                parking,
+                genre1,
+                genre2,
+                genre3,
+                genre_detail,
+                discount_detail,
+            ) = [
+                (row[index].strip() or None) if index is not None else None
+                for index in self._field_indices
+            ]
+
+            # 店舗名（必須）
+            if not name:
                 logger.warning("Shop name is empty, skipping")
                 return None
 
-            # 基本情報
-            shop_id_str = self._get_value(row, "shop_id")
-            city = self._get_value(row, "city")
-            address1 = self._get_value(row, "address1")
-            address2 = self._get_value(row, "address2")
-
             # 住所を結合
             address_parts = []
             if self.prefecture_name:
@@ -70,25 +126,11 @@ class TokyoCsvParser:
 
             address = "".join(address_parts)
 
-            # 連絡先情報
-            phone = self._get_value(row, "phone")
-            website = self._get_value(row, "website")
-
-            # 営業情報
-            business_hours = self._get_value(row, "business_hours")
-            closed_days = self._get_value(row, "closed_days")
-            parking = self._get_value(row, "parking")
-
             # 業種情報
-            genres = []
-            for genre_key in ["genre1", "genre2", "genre3"]:
-                genre = self._get_value(row, genre_key)
-                if genre:
-                    genres.append(genre)
-            genre_detail = self._get_value(row, "genre_detail")
+            genres = [genre for genre in (genre1, genre2, genre3) if genre]
 
             # 優待内容を構築
-            benefits = self._build_benefits(row)
+            benefits = self._build_benefits(row, discount_detail)
 
             # 説明文を構築（業種 + サービス概要）
             description_parts = []
@@ -131,36 +173,13 @@ class TokyoCsvParser:
             logger.error(f"Failed to parse CSV row: {e}")
             raise ParsingError(f"CSV parsing failed: {e}") from e
 
-    def _get_value(self, row: list[str], key: str) -> Optional[str]:
-        """
-        列マッピングから値を取得
-
-        Args:
-            row: CSV行データ
-            key: 列キー（例: "name", "address1"）
-
-        Returns:
-            Optional[str]: 取得した値（存在しない場合はNone）
-        """
-        try:
-            if key not in self.columns:
-                return None
-
-            index = self.columns[key]
-            if index >= len(row):
-                return None
-
-            value = row[index].strip()
-            return value if value else None
-        except Exception:
-            return None
-
-    def _build_benefits(self, row: list[str]) -> Optional[str]:
+    def _build_benefits(self, row: list[str], discount_detail: Optional[str]) -> Optional[str]:
         """
         優待内容を構築
 
         Args:
             row: CSV行データ
+            discount_detail: 割引の詳細（商品の割引の具体的な内容）
 
         Returns:
             Optional[str]: 優待内容の説明文
@@ -168,25 +187,11 @@ class TokyoCsvParser:
         benefits = []
 
         # サービス内容（○がついているもの）
-        services = {
-            "service_milk": "粉ミルクのお湯の提供",
-            "service_diaper": "おむつ替えスペースあり",
-            "service_baby_keep": "トイレにベビーキープ設置",
-            "service_nursing": "授乳スペースあり",
-            "service_kids_space": "キッズスペースあり",
-            "service_stroller": "ベビーカー入店可能",
-            "service_gift": "景品の提供",
-            "service_points": "ポイントの付与",
-            "service_discount": "商品の割引",
-        }
-
-        for key, label in services.items():
-            value = self._get_value(row, key)
-            if value and value == "○":
+        for index, label in self._service_indices:
+            if index < len(row) and row[index].strip() == "○":
                 benefits.append(label)
 
         # 割引の詳細があれば追加
-        discount_detail = self._get_value(row, "discount_detail")
         if discount_detail:
             benefits.append(f"詳細: {discount_detail}")
 
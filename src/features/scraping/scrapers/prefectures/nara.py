@@ -2,13 +2,13 @@
 
 from typing import Optional
 
-import yaml
 from tqdm import tqdm
 
-from .....shared.exceptions.errors import ScraperError
+from .....shared.exceptions.errors import CircuitOpenError, ScraperError
 from .....shared.http.client import HTTPClient
 from .....shared.http.rate_limiter import RateLimiter
 from .....shared.logging.config import get_logger
+from ...config.loader import load_prefecture_config
 from ...domain.models import Shop
 from ...parsers.prefectures.nara_parser import NaraParser
 from ..base import AbstractPrefectureScraper
@@ -33,8 +33,7 @@ class NaraScraper(AbstractPrefectureScraper):
             http_client: HTTPクライアント（Noneの場合は新規作成）
         """
         # 設定ファイルを読み込み
-        with open(config_path, "r", encoding="utf-8") as f:
-            self.config = yaml.safe_load(f)
+        self.config = load_prefecture_config(config_path)
 
         prefecture_code = self.config["prefecture"]["code"]
         prefecture_name = self.config["prefecture"]["name"]
@@ -126,7 +125,7 @@ class NaraScraper(AbstractPrefectureScraper):
                     # 詳細API呼び出し
                     detail_payload = self.config["scraping"]["detail_payload"].copy()
                     # paramsは参照渡しになる可能性があるため、深くコピーするか、ここで再構築
-                    # yaml.safe_loadで辞書になっているので、paramsの中身をコピー
+                    # 設定はプロセス内でキャッシュ共有されているので、paramsの中身をコピー
                     detail_payload["params"] = detail_payload["params"].copy()
                     detail_payload["params"]["baseId"] = shop_id
 
@@ -157,6 +156,9 @@ class NaraScraper(AbstractPrefectureScraper):
                                 current_page = (i // batch_size) + 1
                                 page_complete_callback(current_page)
 
+                except CircuitOpenError:
+                    # ホスト遮断中は後続のリクエストも失敗するため、ジョブごと失敗させる
+                    raise
                 except Exception as e:
                     logger.error(f"Error processing shop {shop_id}: {e}")
                     # 個別のエラーはログに出して続行
@@ -2,13 +2,13 @@
 
 from typing import Optional
 
-import yaml
 from tqdm import tqdm
 
 from .....shared.exceptions.errors import ScraperError
 from .....shared.http.client import HTTPClient
 from .....shared.http.rate_limiter import RateLimiter
 from .....shared.logging.config import get_logger
+from ...config.loader import load_prefecture_config
 from ...domain.models import Shop
 from ...parsers.prefectures.osaka_parser import OsakaParser
 from ..base import AbstractPrefectureScraper
@@ -34,8 +34,7 @@ class OsakaScraper(AbstractPrefectureScraper):
             http_client: HTTPクライアント（Noneの場合は新規作成）
         """
         # 設定ファイルを読み込み
-        with open(config_path, "r", encoding="utf-8") as f:
-            self.config = yaml.safe_load(f)
+        self.config = load_prefecture_config(config_path)
 
         prefecture_code = self.config["prefecture"]["code"]
         prefecture_name = self.config["prefecture"]["name"]
@@ -4,13 +4,19 @@ import re
 from typing import Optional
 from urllib.parse import urljoin, urlparse
 
-import yaml
 from tqdm import tqdm
 
-from .....shared.exceptions.errors import HTTPError, ParsingError, ScraperError, SessionError
+from .....shared.exceptions.errors import (
+    CircuitOpenError,
+    HTTPError,
+    ParsingError,
+    ScraperError,
+    SessionError,
+)
 from .....shared.http.client import HTTPClient
 from .....shared.http.rate_limiter import RateLimiter
 from .....shared.logging.config import get_logger
+from ...config.loader import load_prefecture_config
 from ...domain.models import Shop
 from ...parsers.prefectures.tokyo_parser import TokyoParser
 from ..base import AbstractPrefectureScraper
@@ -37,8 +43,7 @@ class TokyoScraper(AbstractPrefectureScraper):
             http_client: HTTPクライアント（Noneの場合は新規作成）
         """
         # 設定ファイルを読み込み
-        with open(config_path, "r", encoding="utf-8") as f:
-            self.config = yaml.safe_load(f)
+        self.config = load_prefecture_config(config_path)
 
         prefecture_code = self.config["prefecture"]["code"]
         prefecture_name = self.config["prefecture"]["name"]
@@ -187,13 +192,12 @@ class TokyoScraper(AbstractPrefectureScraper):
                     # レート制限
                     self.rate_limiter.wait()
 
-                    # 各詳細ページをパース
-                    for detail_url in tqdm(detail_links, leave=False, desc=f"詳細({page_num})"):
-                        if detail_url in seen_urls:
-                            continue
-
-                        seen_urls.add(detail_url)
+                    # 未取得のリンクのみを抽出（ページ内の重複も除去）
+                    new_links = [u for u in dict.fromkeys(detail_links) if u not in seen_urls]
+                    seen_urls.update(new_links)
 
+                    # 各詳細ページをパース
+                    for detail_url in tqdm(new_links, leave=False, desc=f"詳細({page_num})"):
                         # 店舗情報を取得
                         shop = self.parse_detail_page(detail_url)
 
@@ -299,6 +303,9 @@ class TokyoScraper(AbstractPrefectureScraper):
             logger.debug(f"Found {len(links)} detail links on page {page_num}")
             return links
 
+        except CircuitOpenError:
+            # ホスト遮断中は後続のリクエストも失敗するため、ジョブごと失敗させる
+            raise
         except HTTPError as e:
             logger.error(f"Failed to get detail links from page {page_num}: {e}")
             return []
@@ -328,6 +335,9 @@ class TokyoScraper(AbstractPrefectureScraper):
 
             return shop
 
+        except CircuitOpenError:
+            # ホスト遮断中は後続のリクエストも失敗するため、ジョブごと失敗させる
+            raise
         except HTTPError as e:
             logger.error(f"Failed to fetch detail page {url}: {e}")
             return None
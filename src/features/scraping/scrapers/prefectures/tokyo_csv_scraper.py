@@ -1,16 +1,22 @@
 """東京都CSVスクレイパー"""
 
 import csv
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import partial
 from io import StringIO
-from typing import Optional
+from typing import Iterator, Optional
 
-import yaml
 from tqdm import tqdm
 
 from .....shared.exceptions.errors import HTTPError, ParsingError, ScraperError
 from .....shared.http.client import HTTPClient
 from .....shared.http.rate_limiter import RateLimiter
 from .....shared.logging.config import get_logger
+from .....shared.utils.datetime_utils import batch_now_jst, freeze_time
+from ...config.loader import load_prefecture_config
 from ...domain.models import Shop
 from ...parsers.prefectures.tokyo_csv_parser import TokyoCsvParser
 from ..base import AbstractPrefectureScraper
@@ -18,6 +24,34 @@ from ..base import AbstractPrefectureScraper
 logger = get_logger(__name__)
 
 
+def _parse_rows(
+    prefecture_code: str,
+    prefecture_name: str,
+    column_mapping: dict,
+    frozen_at: datetime,
+    rows: list[list[str]],
+) -> list[Shop]:
+    """
+    CSV行のチャンクを解析（ワーカープロセスで実行）
+
+    ワーカープロセスには親の freeze_time() が引き継がれないため、
+    親で取得した時刻を受け取って固定し直す。
+
+    Args:
+        prefecture_code: 都道府県コード
+        prefecture_name: 都道府県名
+        column_mapping: CSVカラムのインデックスマッピング
+        frozen_at: 店舗に付与するスクレイピング日時（親プロセスの batch_now_jst()）
+        rows: CSV行データのリスト
+
+    Returns:
+        list[Shop]: 店舗リスト
+    """
+    parser = TokyoCsvParser(prefecture_code, prefecture_name, column_mapping)
+    with freeze_time(frozen_at):
+        return [shop for shop in map(parser.parse_row, rows) if shop]
+
+
 class TokyoCsvScraper(AbstractPrefectureScraper):
     """
     東京都の店舗情報スクレイパー（CSV方式）
@@ -36,8 +70,7 @@ class TokyoCsvScraper(AbstractPrefectureScraper):
             http_client: HTTPクライアント（Noneの場合は新規作成）
         """
         # 設定ファイルを読み込み
-        with open(config_path, "r", encoding="utf-8") as f:
-            self.config = yaml.safe_load(f)
+        self.config = load_prefecture_config(config_path)
 
         prefecture_code = self.config["prefecture"]["code"]
         prefecture_name = self.config["prefecture"]["name"]
@@ -62,6 +95,8 @@ class TokyoCsvScraper(AbstractPrefectureScraper):
         self.csv_url = csv_config["url"]
         self.encoding = csv_config["encoding"]
         self.column_mapping = csv_config["columns"]
+        self.parse_workers = csv_config.get("parse_workers", 1)
+        self.max_bytes = csv_config.get("max_bytes", 100_000_000)
 
         # パーサー初期化
         self.parser = TokyoCsvParser(
@@ -122,7 +157,8 @@ class TokyoCsvScraper(AbstractPrefectureScraper):
         try:
             logger.info(f"Downloading CSV: {self.csv_url}")
 
-            response = self.http_client.get(self.csv_url)
+            # 想定外に巨大な応答はmax_bytesを超えた時点で打ち切る
+            response = self.http_client.get(self.csv_url, stream=True, max_bytes=self.max_bytes)
 
             # Shift-JIS → UTF-8に変換（エラー文字は置換）
             csv_text = response.content.decode(self.encoding, errors="replace")
@@ -157,7 +193,8 @@ class TokyoCsvScraper(AbstractPrefectureScraper):
             logger.info("Parsing CSV data...")
 
             all_shops: list[Shop] = []
-            current_batch: list[Shop] = []
+            # 未処理バッチの開始位置（バッチは常にall_shopsの末尾スライス）
+            batch_start = 0
 
             # CSVリーダー作成
             csv_reader = csv.reader(StringIO(csv_text))
@@ -166,25 +203,23 @@ class TokyoCsvScraper(AbstractPrefectureScraper):
             next(csv_reader, None)
 
             # 各行を解析
-            for row in tqdm(csv_reader, desc="CSV解析"):
-                shop = self.parser.parse_row(row)
-
-                if shop:
-                    all_shops.append(shop)
-                    current_batch.append(shop)
-
-                    # バッチサイズに達したらコールバックを実行
-                    if batch_callback and len(current_batch) >= batch_size:
-                        logger.info(f"Processing batch: {len(current_batch)} shops")
-                        try:
-                            batch_callback(current_batch)
-                            current_batch = []  # バッチをクリア
-                        except Exception as e:
-                            logger.error(f"Batch callback failed: {e}")
-                            # エラーが発生してもスクレイピングは続行
+            for shop in self._iter_shops(csv_reader):
+                all_shops.append(shop)
+
+                # バッチサイズに達したらコールバックを実行
+                if batch_callback and len(all_shops) - batch_start >= batch_size:
+                    current_batch = all_shops[batch_start:]
+                    logger.info(f"Processing batch: {len(current_batch)} shops")
+                    try:
+                        batch_callback(current_batch)
+                        batch_start = len(all_shops)  # バッチをクリア
+                    except Exception as e:
+                        logger.error(f"Batch callback failed: {e}")
+                        # エラーが発生してもスクレイピングは続行
 
             # 最後の残りのバッチを処理
-            if batch_callback and current_batch:
+            if batch_callback and batch_start < len(all_shops):
+                current_batch = all_shops[batch_start:]
                 logger.info(f"Processing final batch: {len(current_batch)} shops")
                 try:
                     batch_callback(current_batch)
@@ -196,6 +231,53 @@ class TokyoCsvScraper(AbstractPrefectureScraper):
         except Exception as e:
             raise ParsingError(f"Failed to parse CSV: {e}") from e
 
+    def _iter_shops(self, csv_reader: Iterator[list[str]]) -> Iterator[Shop]:
+        """
+        CSV行を解析してShopを順に返す
+
+        parse_workersが2以上の場合は行をチャンクに分割してプロセス並列で解析し、
+        チャンクの完了順ではなく元の行順で返す。
+
+        Args:
+            csv_reader: CSVリーダー（ヘッダー行は読み飛ばし済み）
+
+        Yields:
+            Shop: 店舗オブジェクト
+        """
+        if self.parse_workers <= 1:
+            # 進捗表示の更新は1000行ごと・0.5秒間隔に間引く
+            for row in tqdm(
+                csv_reader, desc="CSV解析", miniters=1000, mininterval=0.5, smoothing=0
+            ):
+                shop = self.parser.parse_row(row)
+                if shop:
+                    yield shop
+            return
+
+        # クォート内の改行を壊さないよう、行分割はCSVリーダーで済ませてから分配
+        rows = list(csv_reader)
+        chunk_size = max(1, math.ceil(len(rows) / self.parse_workers))
+        chunks = [rows[i : i + chunk_size] for i in range(0, len(rows), chunk_size)]
+
+        logger.info(
+            f"Parsing {len(rows)} rows with {self.parse_workers} processes "
+            f"({len(chunks)} chunks)"
+        )
+
+        worker = partial(
+            _parse_rows,
+            self.prefecture_code,
+            self.prefecture_name,
+            self.column_mapping,
+            batch_now_jst(),
+        )
+        # gRPC（Firestore）のスレッドが動いているプロセスをforkしないようspawnで起動
+        with ProcessPoolExecutor(
+            max_workers=self.parse_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            for shops in executor.map(worker, chunks):
+                yield from shops
+
     def get_detail_links(self, page_num: int) -> list[str]:
         """
         CSV方式では使用しない（抽象メソッドの実装のみ）
@@ -1,8 +1,12 @@
 """Firestoreクライアント"""
 
+import itertools
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Optional
 
+from google.api_core import exceptions as gcp_exceptions
 from google.cloud import firestore
 from google.cloud.firestore_v1.base_query import FieldFilter
 
@@ -11,26 +15,42 @@ from ....shared.logging.config import get_logger
 
 logger = get_logger(__name__)
 
+# バッチコミット時にリトライする一時的なエラー
+_RETRYABLE_COMMIT_ERRORS = (
+    gcp_exceptions.Aborted,
+    gcp_exceptions.DeadlineExceeded,
+    gcp_exceptions.ServiceUnavailable,
+)
+
 
 class FirestoreClient:
     """Firestore操作クライアント"""
 
-    def __init__(self, project_id: str, database_id: str = "(default)") -> None:
+    def __init__(self, project_id: str, database_id: str = "(default)", pool_size: int = 1) -> None:
         """
         Firestoreクライアントを初期化
 
         Args:
             project_id: GCPプロジェクトID
             database_id: データベースID（デフォルトは"(default)"）
+            pool_size: 内部で保持するfirestore.Clientの数（2以上でラウンドロビン）
         """
+        if pool_size < 1:
+            raise ValueError("pool_size must be >= 1")
+
         self.project_id = project_id
         self.database_id = database_id
+        self.pool_size = pool_size
 
         # エミュレータモードの検出
         emulator_host = os.environ.get("FIRESTORE_EMULATOR_HOST")
 
         try:
-            self.client = firestore.Client(project=project_id, database=database_id)
+            # 1チャネルへのリクエスト集中を避けるため、複数クライアントを順番に使用
+            self._clients = [
+                firestore.Client(project=project_id, database=database_id) for _ in range(pool_size)
+            ]
+            self._client_cycle = itertools.cycle(self._clients)
 
             if emulator_host:
                 logger.info(
@@ -39,11 +59,24 @@ class FirestoreClient:
                 )
             else:
                 logger.info(
-                    f"Firestore client initialized: project={project_id}, database={database_id}"
+                    f"Firestore client initialized: project={project_id}, database={database_id}, "
+                    f"pool_size={pool_size}"
                 )
         except Exception as e:
             raise StorageError(f"Failed to initialize Firestore client: {e}") from e
 
+    @property
+    def client(self) -> firestore.Client:
+        """
+        firestore.Clientを取得（プールがある場合はラウンドロビン）
+
+        Returns:
+            firestore.Client: Firestoreクライアント
+        """
+        if self.pool_size == 1:
+            return self._clients[0]
+        return next(self._client_cycle)
+
     def get_collection(self, collection_path: str) -> firestore.CollectionReference:
         """
         コレクション参照を取得
@@ -62,15 +95,17 @@ class FirestoreClient:
         documents: list[dict[str, Any]],
         batch_size: int = 500,
         id_field: str = "shop_id",
+        max_workers: int = 10,
     ) -> None:
         """
-        バッチ書き込み（500件ずつ）
+        バッチ書き込み（500件ずつ、複数バッチは並列にコミット）
 
         Args:
             collection_path: コレクションパス
             documents: 書き込むドキュメントのリスト
             batch_size: バッチサイズ（デフォルト500、最大500）
             id_field: ドキュメントIDとして使用するフィールド名
+            max_workers: 並列コミットの最大スレッド数
 
         Raises:
             StorageError: 書き込みに失敗した場合
@@ -82,34 +117,85 @@ class FirestoreClient:
             logger.info("No documents to write")
             return
 
-        collection = self.get_collection(collection_path)
-        total = len(documents)
+        # IDフィールドのないドキュメントは事前に除外（ログはまとめて1回）
+        valid_documents = [doc for doc in documents if doc.get(id_field)]
+        skipped = len(documents) - len(valid_documents)
+        if skipped:
+            sample = next(doc for doc in documents if not doc.get(id_field))
+            logger.warning(f"Skipping {skipped} documents missing {id_field}; sample={sample!r}")
+
+        total = len(valid_documents)
         written = 0
 
+        chunks = [valid_documents[i : i + batch_size] for i in range(0, total, batch_size)]
+
         try:
-            for i in range(0, total, batch_size):
-                batch = self.client.batch()
-                chunk = documents[i : i + batch_size]
+            if len(chunks) <= 1 or max_workers <= 1:
+                for chunk in chunks:
+                    written += self._commit_chunk(collection_path, chunk, id_field)
+                    logger.info(
+                        f"Batch write: {written}/{total} documents written to {collection_path}"
+                    )
+            else:
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+                    futures = [
+                        executor.submit(self._commit_chunk, collection_path, chunk, id_field)
+                        for chunk in chunks
+                    ]
+                    for future in as_completed(futures):
+                        written += future.result()
+                        logger.info(
+                            f"Batch write: {written}/{total} documents written to {collection_path}"
+                        )
+
+            logger.info(f"Batch write completed: {written} documents written to {collection_path}")
 
-                for doc in chunk:
-                    doc_id = doc.get(id_field)
-                    if not doc_id:
-                        logger.warning(f"Document missing {id_field}, skipping: {doc}")
-                        continue
+        except Exception as e:
+            raise StorageError(f"Failed to batch write to {collection_path}: {e}") from e
+
+    def _commit_chunk(
+        self,
+        collection_path: str,
+        chunk: list[dict[str, Any]],
+        id_field: str,
+        max_attempts: int = 3,
+        backoff_seconds: float = 0.5,
+    ) -> int:
+        """
+        1バッチ分（最大500件）をコミット（一時的なエラーは指数バックオフでリトライ）
 
-                    doc_ref = collection.document(str(doc_id))
-                    batch.set(doc_ref, doc, merge=True)
+        Args:
+            collection_path: コレクションパス
+            chunk: 書き込むドキュメントのリスト
+            id_field: ドキュメントIDとして使用するフィールド名
+            max_attempts: 最大試行回数
+            backoff_seconds: 初回リトライまでの待機時間（秒）
 
+        Returns:
+            int: 書き込んだドキュメント数
+        """
+        for attempt in range(1, max_attempts + 1):
+            # バッチとドキュメント参照は同じプールクライアントから作る
+            client = self.client
+            collection = client.collection(collection_path)
+            batch = client.batch()
+            for doc in chunk:
+                batch.set(collection.document(str(doc[id_field])), doc, merge=True)
+
+            try:
                 batch.commit()
-                written += len(chunk)
-                logger.info(
-                    f"Batch write: {written}/{total} documents written to {collection_path}"
+                return len(chunk)
+            except _RETRYABLE_COMMIT_ERRORS as e:
+                if attempt == max_attempts:
+                    raise
+                wait = backoff_seconds * 2 ** (attempt - 1)
+                logger.warning(
+                    f"Batch commit failed (attempt {attempt}/{max_attempts}), "
+                    f"retrying in {wait:.1f}s: {e}"
                 )
+                time.sleep(wait)
 
-            logger.info(f"Batch write completed: {written} documents written to {collection_path}")
-
-        except Exception as e:
-            raise StorageError(f"Failed to batch write to {collection_path}: {e}") from e
+        return 0
 
     def get_document(self, collection_path: str, document_id: str) -> Optional[dict[str, Any]]:
         """
@@ -135,11 +221,51 @@ class FirestoreClient:
                 f"Failed to get document {document_id} from {collection_path}: {e}"
             ) from e
 
+    def batch_get_documents(
+        self,
+        collection_path: str,
+        document_ids: list[str],
+        chunk_size: int = 300,
+        field_paths: Optional[list[str]] = None,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        複数のドキュメントをまとめて取得（get_allで1往復あたりchunk_size件）
+
+        Args:
+            collection_path: コレクションパス
+            document_ids: ドキュメントIDのリスト
+            chunk_size: 1回のget_allで取得する件数
+            field_paths: 取得するフィールドのリスト（Noneの場合は全フィールド、
+                存在確認のみなら["__name__"]）
+
+        Returns:
+            dict[str, dict[str, Any]]: ドキュメントID → ドキュメントデータ（存在するもののみ）
+        """
+        if not document_ids:
+            return {}
+
+        try:
+            documents: dict[str, dict[str, Any]] = {}
+
+            for i in range(0, len(document_ids), chunk_size):
+                client = self.client
+                collection = client.collection(collection_path)
+                refs = [collection.document(doc_id) for doc_id in document_ids[i : i + chunk_size]]
+                for snapshot in client.get_all(refs, field_paths=field_paths):
+                    if snapshot.exists:
+                        documents[snapshot.id] = snapshot.to_dict()
+
+            return documents
+
+        except Exception as e:
+            raise StorageError(f"Failed to batch get documents from {collection_path}: {e}") from e
+
     def query_documents(
         self,
         collection_path: str,
         filters: Optional[list[tuple[str, str, Any]]] = None,
         limit: Optional[int] = None,
+        projection: Optional[list[str]] = None,
     ) -> list[dict[str, Any]]:
         """
         条件に一致するドキュメントを取得
@@ -148,6 +274,7 @@ class FirestoreClient:
             collection_path: コレクションパス
             filters: フィルタ条件のリスト [(field, operator, value), ...]
             limit: 取得件数の上限
+            projection: 取得するフィールド名のリスト（Noneの場合は全フィールド）
 
         Returns:
             list[dict[str, Any]]: ドキュメントのリスト
@@ -160,17 +287,12 @@ class FirestoreClient:
             ... )
         """
         try:
-            query = self.get_collection(collection_path)
-
-            if filters:
-                for field, operator, value in filters:
-                    query = query.where(filter=FieldFilter(field, operator, value))
+            query = self._build_query(collection_path, filters, limit)
 
-            if limit:
-                query = query.limit(limit)
+            if projection:
+                query = query.select(projection)
 
-            docs = query.stream()
-            return [doc.to_dict() for doc in docs if doc.exists]
+            return [doc.to_dict() for doc in query.stream()]
 
         except Exception as e:
             raise StorageError(f"Failed to query documents from {collection_path}: {e}") from e
@@ -230,11 +352,7 @@ class FirestoreClient:
             int: ドキュメント数
         """
         try:
-            query = self.get_collection(collection_path)
-
-            if filters:
-                for field, operator, value in filters:
-                    query = query.where(filter=FieldFilter(field, operator, value))
+            query = self._build_query(collection_path, filters)
 
             # count()メソッドを使用（Firestore v2.11.0以降）
             agg_query = query.count()
@@ -245,3 +363,31 @@ class FirestoreClient:
 
         except Exception as e:
             raise StorageError(f"Failed to count documents in {collection_path}: {e}") from e
+
+    def _build_query(
+        self,
+        collection_path: str,
+        filters: Optional[list[tuple[str, str, Any]]] = None,
+        limit: Optional[int] = None,
+    ) -> firestore.Query:
+        """
+        フィルタ条件からクエリを組み立て
+
+        Args:
+            collection_path: コレクションパス
+            filters: フィルタ条件のリスト [(field, operator, value), ...]
+            limit: 取得件数の上限
+
+        Returns:
+            Query: クエリ
+        """
+        query = self.get_collection(collection_path)
+
+        if filters:
+            for field, operator, value in filters:
+                query = query.where(filter=FieldFilter(field, operator, value))
+
+        if limit:
+            query = query.limit(limit)
+
+        return query
@@ -1,14 +1,21 @@
 """スクレイピング履歴リポジトリ"""
 
-from typing import Optional
+from typing import Iterator, Optional
+
+from google.cloud import firestore
+from google.cloud.firestore_v1.base_query import FieldFilter
 
 from ....shared.exceptions.errors import StorageError
 from ....shared.logging.config import get_logger
+from ...scraping.domain.enums import ScrapingStatus
 from ...scraping.domain.models import ScrapingResult
 from ..clients.firestore_client import FirestoreClient
 
 logger = get_logger(__name__)
 
+# ステータス値 → Enumのルックアップテーブル（行ごとのEnum生成を避ける）
+_STATUS_MAP = {status.value: status for status in ScrapingStatus}
+
 
 class HistoryRepository:
     """スクレイピング履歴のリポジトリ"""
@@ -25,6 +32,11 @@ class HistoryRepository:
         self.client = firestore_client
         logger.info("HistoryRepository initialized")
 
+    @property
+    def _collection(self) -> firestore.CollectionReference:
+        """コレクション参照（呼び出しごとにプールからクライアントを選択）"""
+        return self.client.get_collection(self.COLLECTION_NAME)
+
     def save(self, result: ScrapingResult) -> None:
         """
         スクレイピング結果を保存
@@ -37,8 +49,7 @@ class HistoryRepository:
         """
         try:
             result_dict = result.to_firestore_dict()
-            collection = self.client.get_collection(self.COLLECTION_NAME)
-            doc_ref = collection.document(result.run_id)
+            doc_ref = self._collection.document(result.run_id)
 
             doc_ref.set(result_dict, merge=True)
             logger.info(
@@ -80,21 +91,16 @@ class HistoryRepository:
         """
         try:
             # started_atで降順ソート（最新を取得）
-            collection = self.client.get_collection(self.COLLECTION_NAME)
             query = (
-                collection.where(
-                    filter=collection._client._firestore_api.FieldFilter(
-                        "prefecture_code", "==", prefecture_code
-                    )
-                )
+                self._collection.where(filter=FieldFilter("prefecture_code", "==", prefecture_code))
                 .order_by("started_at", direction="DESCENDING")
                 .limit(1)
             )
 
-            docs = list(query.stream())
+            doc = next(iter(query.stream()), None)
 
-            if docs and docs[0].exists:
-                return self._from_firestore_dict(docs[0].to_dict())
+            if doc is not None:
+                return self._from_firestore_dict(doc.to_dict())
             return None
 
         except Exception as e:
@@ -115,26 +121,36 @@ class HistoryRepository:
         Returns:
             list[ScrapingResult]: スクレイピング結果のリスト（新しい順）
         """
+        results = list(self.iter_history_by_prefecture(prefecture_code, limit))
+
+        logger.info(
+            f"Retrieved {len(results)} scraping history records for prefecture {prefecture_code}"
+        )
+
+        return results
+
+    def iter_history_by_prefecture(
+        self, prefecture_code: str, limit: int = 100
+    ) -> Iterator[ScrapingResult]:
+        """
+        都道府県のスクレイピング履歴を1件ずつ取得（全件をメモリに保持しない）
+
+        Args:
+            prefecture_code: 都道府県コード
+            limit: 取得件数の上限
+
+        Yields:
+            ScrapingResult: スクレイピング結果（新しい順）
+        """
         try:
-            collection = self.client.get_collection(self.COLLECTION_NAME)
             query = (
-                collection.where(
-                    filter=collection._client._firestore_api.FieldFilter(
-                        "prefecture_code", "==", prefecture_code
-                    )
-                )
+                self._collection.where(filter=FieldFilter("prefecture_code", "==", prefecture_code))
                 .order_by("started_at", direction="DESCENDING")
                 .limit(limit)
             )
 
-            docs = query.stream()
-            results = [self._from_firestore_dict(doc.to_dict()) for doc in docs if doc.exists]
-
-            logger.info(
-                f"Retrieved {len(results)} scraping history records for prefecture {prefecture_code}"
-            )
-
-            return results
+            for doc in query.stream():
+                yield self._from_firestore_dict(doc.to_dict())
 
         except Exception as e:
             raise StorageError(
@@ -151,16 +167,27 @@ class HistoryRepository:
         Returns:
             list[ScrapingResult]: スクレイピング結果のリスト（新しい順）
         """
-        try:
-            collection = self.client.get_collection(self.COLLECTION_NAME)
-            query = collection.order_by("started_at", direction="DESCENDING").limit(limit)
+        results = list(self.iter_recent_results(limit))
 
-            docs = query.stream()
-            results = [self._from_firestore_dict(doc.to_dict()) for doc in docs if doc.exists]
+        logger.info(f"Retrieved {len(results)} recent scraping results")
 
-            logger.info(f"Retrieved {len(results)} recent scraping results")
+        return results
 
-            return results
+    def iter_recent_results(self, limit: int = 50) -> Iterator[ScrapingResult]:
+        """
+        最近のスクレイピング結果を1件ずつ取得（全件をメモリに保持しない）
+
+        Args:
+            limit: 取得件数の上限
+
+        Yields:
+            ScrapingResult: スクレイピング結果（新しい順）
+        """
+        try:
+            query = self._collection.order_by("started_at", direction="DESCENDING").limit(limit)
+
+            for doc in query.stream():
+                yield self._from_firestore_dict(doc.to_dict())
 
         except Exception as e:
             raise StorageError(f"Failed to get recent scraping results: {e}") from e
@@ -176,18 +203,18 @@ class HistoryRepository:
             dict[str, int]: ステータスごとの実行回数
         """
         try:
-            filters = []
+            base_filters = []
             if prefecture_code:
-                filters.append(("prefecture_code", "==", prefecture_code))
-
-            # 全件取得してクライアント側でカウント
-            # （Firestoreのgroup byは制限があるため）
-            docs = self.client.query_documents(self.COLLECTION_NAME, filters=filters)
+                base_filters.append(("prefecture_code", "==", prefecture_code))
 
+            # ステータスごとにサーバー側のCOUNT集計を実行
+            # （Firestoreにはgroup byがないため、既知のステータス数だけクエリを発行）
             status_counts: dict[str, int] = {}
-            for doc in docs:
-                status = doc.get("status", "unknown")
-                status_counts[status] = status_counts.get(status, 0) + 1
+            for status in ScrapingStatus:
+                filters = base_filters + [("status", "==", status.value)]
+                count = self.client.count_documents(self.COLLECTION_NAME, filters=filters)
+                if count:
+                    status_counts[status.value] = count
 
             logger.info(f"Status counts: {status_counts}")
 
@@ -223,15 +250,13 @@ class HistoryRepository:
         Returns:
             ScrapingResult: スクレイピング結果オブジェクト
         """
-        from ...scraping.domain.enums import ScrapingStatus
-
         return ScrapingResult(
             run_id=data["run_id"],
             prefecture_code=data["prefecture_code"],
             prefecture_name=data["prefecture_name"],
             started_at=data["started_at"],
             completed_at=data.get("completed_at"),
-            status=ScrapingStatus(data.get("status", "pending")),
+            status=_STATUS_MAP.get(data.get("status", "pending"), ScrapingStatus.PENDING),
             total_shops=data.get("total_shops", 0),
             new_shops=data.get("new_shops", 0),
             updated_shops=data.get("updated_shops", 0),
@@ -3,6 +3,8 @@
 from datetime import datetime
 from typing import Optional
 
+from google.cloud import firestore
+
 from ....shared.exceptions.errors import StorageError
 from ....shared.logging.config import get_logger
 from ..clients.firestore_client import FirestoreClient
@@ -10,6 +12,44 @@ from ..clients.firestore_client import FirestoreClient
 logger = get_logger(__name__)
 
 
+def _encode_pages(pages: list[int]) -> bytes:
+    """
+    ページ番号のリストをビットマップ（ページpはバイトp>>3のビットp&7）に変換
+
+    Args:
+        pages: ページ番号のリスト
+
+    Returns:
+        bytes: ビットマップ
+    """
+    if not pages:
+        return b""
+
+    buf = bytearray((max(pages) >> 3) + 1)
+    for page in pages:
+        buf[page >> 3] |= 1 << (page & 7)
+    return bytes(buf)
+
+
+def _decode_pages(bitmap: bytes) -> list[int]:
+    """
+    ビットマップをページ番号のリスト（昇順）に変換
+
+    Args:
+        bitmap: ビットマップ
+
+    Returns:
+        list[int]: ページ番号のリスト
+    """
+    return [
+        (index << 3) | bit
+        for index, byte in enumerate(bitmap)
+        if byte
+        for bit in range(8)
+        if byte & (1 << bit)
+    ]
+
+
 class ProgressRepository:
     """スクレイピング進捗のリポジトリ"""
 
@@ -25,6 +65,11 @@ class ProgressRepository:
         self.client = firestore_client
         logger.info("ProgressRepository initialized")
 
+    @property
+    def _collection(self) -> firestore.CollectionReference:
+        """コレクション参照（呼び出しごとにプールからクライアントを選択）"""
+        return self.client.get_collection(self.COLLECTION_NAME)
+
     def save_progress(
         self,
         prefecture_code: str,
@@ -35,6 +80,10 @@ class ProgressRepository:
         """
         進捗を保存
 
+        ドキュメント全体を書き換えるため、ジョブ開始時の初期化に使用する。
+        以降のページ完了は mark_page_complete() で差分のみ更新する。
+        完了済みページはビットマップ（completed_pages_bitmap）として保存する。
+
         Args:
             prefecture_code: 都道府県コード
             completed_pages: 完了済みページリスト
@@ -42,12 +91,11 @@ class ProgressRepository:
             last_shop_id: 最後に処理した店舗ID
         """
         try:
-            collection = self.client.get_collection(self.COLLECTION_NAME)
-            doc_ref = collection.document(prefecture_code)
+            doc_ref = self._collection.document(prefecture_code)
 
             progress_data = {
                 "prefecture_code": prefecture_code,
-                "completed_pages": completed_pages,
+                "completed_pages_bitmap": _encode_pages(completed_pages),
                 "total_shops_saved": total_shops_saved,
                 "last_shop_id": last_shop_id,
                 "updated_at": datetime.now(),
@@ -62,6 +110,44 @@ class ProgressRepository:
             logger.error(f"Failed to save progress: {e}")
             raise StorageError(f"Failed to save progress: {e}") from e
 
+    def mark_page_complete(
+        self,
+        prefecture_code: str,
+        completed_pages: list[int],
+        shops_added: int,
+        last_shop_id: str,
+    ) -> None:
+        """
+        ページ完了を差分で記録
+
+        完了済みページはビットマップで上書きする（1ページ1ビットのため配列より十分小さい）。
+        店舗数はIncrementでサーバー側に加算し、旧形式の completed_pages 配列は削除する。
+
+        Args:
+            prefecture_code: 都道府県コード
+            completed_pages: 完了済みページリスト
+            shops_added: 前回の進捗保存以降に保存した店舗数
+            last_shop_id: 最後に処理した店舗ID
+        """
+        try:
+            doc_ref = self._collection.document(prefecture_code)
+            doc_ref.set(
+                {
+                    "prefecture_code": prefecture_code,
+                    "completed_pages_bitmap": _encode_pages(completed_pages),
+                    "completed_pages": firestore.DELETE_FIELD,
+                    "total_shops_saved": firestore.Increment(shops_added),
+                    "last_shop_id": last_shop_id,
+                    "updated_at": firestore.SERVER_TIMESTAMP,
+                },
+                merge=True,
+            )
+            logger.info(f"Page marked complete: {prefecture_code}, pages={len(completed_pages)}")
+
+        except Exception as e:
+            logger.error(f"Failed to mark page complete: {e}")
+            raise StorageError(f"Failed to mark page complete: {e}") from e
+
     def get_progress(self, prefecture_code: str) -> Optional[dict]:
         """
         進捗を取得
@@ -70,15 +156,21 @@ class ProgressRepository:
             prefecture_code: 都道府県コード
 
         Returns:
-            Optional[dict]: 進捗データ（存在しない場合はNone）
+            Optional[dict]: 進捗データ（存在しない場合はNone）。
+                completed_pagesにはビットマップを展開したページリストを格納
         """
         try:
-            collection = self.client.get_collection(self.COLLECTION_NAME)
-            doc_ref = collection.document(prefecture_code)
+            doc_ref = self._collection.document(prefecture_code)
             doc = doc_ref.get()
 
             if doc.exists:
                 progress = doc.to_dict()
+                bitmap = progress.get("completed_pages_bitmap")
+                if bitmap is not None:
+                    # 旧形式の配列が残っていれば統合（次回の mark_page_complete で削除される）
+                    pages = set(_decode_pages(bitmap))
+                    pages.update(progress.get("completed_pages", []))
+                    progress["completed_pages"] = sorted(pages)
                 logger.info(
                     f"Progress loaded: {prefecture_code}, pages={len(progress.get('completed_pages', []))}"
                 )
@@ -99,8 +191,7 @@ class ProgressRepository:
             prefecture_code: 都道府県コード
         """
         try:
-            collection = self.client.get_collection(self.COLLECTION_NAME)
-            doc_ref = collection.document(prefecture_code)
+            doc_ref = self._collection.document(prefecture_code)
             doc_ref.delete()
             logger.info(f"Progress cleared: {prefecture_code}")
 
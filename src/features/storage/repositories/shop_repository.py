@@ -1,10 +1,12 @@
 """店舗リポジトリ"""
 
-from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
+
+from google.cloud import firestore
 
 from ....shared.exceptions.errors import StorageError, ValidationError
 from ....shared.logging.config import get_logger
+from ....shared.utils.datetime_utils import batch_now_jst
 from ...scraping.domain.models import Shop
 from ..clients.firestore_client import FirestoreClient
 
@@ -26,6 +28,11 @@ class ShopRepository:
         self.client = firestore_client
         logger.info("ShopRepository initialized")
 
+    @property
+    def _collection(self) -> firestore.CollectionReference:
+        """コレクション参照（呼び出しごとにプールからクライアントを選択）"""
+        return self.client.get_collection(self.COLLECTION_NAME)
+
     def save(self, shop: Shop) -> None:
         """
         店舗を保存（新規作成または更新）
@@ -41,24 +48,15 @@ class ShopRepository:
 
         try:
             # 更新日時を設定
-            shop.updated_at = datetime.now()
+            shop.updated_at = batch_now_jst()
 
             # Firestoreに保存
             shop_dict = shop.to_firestore_dict()
-            collection = self.client.get_collection(self.COLLECTION_NAME)
-            doc_ref = collection.document(shop.shop_id)
+            doc_ref = self._collection.document(shop.shop_id)
 
-            # 既存ドキュメントの確認
-            existing_doc = doc_ref.get()
-
-            if existing_doc.exists:
-                # 更新
-                doc_ref.set(shop_dict, merge=True)
-                logger.info(f"Shop updated: {shop.shop_id} - {shop.name}")
-            else:
-                # 新規作成
-                doc_ref.set(shop_dict)
-                logger.info(f"Shop created: {shop.shop_id} - {shop.name}")
+            # 新規・更新を区別せずマージ書き込み（事前の存在確認の読み取りは不要）
+            doc_ref.set(shop_dict, merge=True)
+            logger.info(f"Shop saved: {shop.shop_id} - {shop.name}")
 
         except ValidationError:
             raise
@@ -82,14 +80,12 @@ class ShopRepository:
             logger.info("No shops to save")
             return {"created": 0, "updated": 0}
 
-        new_count = 0
-        updated_count = 0
-
         try:
             # 既存店舗IDを取得
             existing_ids = self._get_existing_shop_ids([shop.shop_id for shop in shops])
 
-            # 店舗をFirestore形式に変換
+            # 店舗をFirestore形式に変換（バッチ内の更新日時は共通）
+            now = batch_now_jst()
             shop_dicts = []
             for shop in shops:
                 # バリデーション
@@ -100,16 +96,15 @@ class ShopRepository:
                     continue
 
                 # 更新日時を設定
-                shop.updated_at = datetime.now()
-
-                # カウント
-                if shop.shop_id in existing_ids:
-                    updated_count += 1
-                else:
-                    new_count += 1
+                shop.updated_at = now
 
                 shop_dicts.append(shop.to_firestore_dict())
 
+            # カウント（バリデーション済みの店舗IDと既存IDの集合演算）
+            input_ids = {shop_dict["shop_id"] for shop_dict in shop_dicts}
+            updated_count = len(input_ids & existing_ids)
+            new_count = len(input_ids - existing_ids)
+
             # バッチ書き込み
             self.client.batch_write(self.COLLECTION_NAME, shop_dicts, id_field="shop_id")
 
@@ -171,40 +166,67 @@ class ShopRepository:
             raise StorageError(f"Failed to get shops for prefecture {prefecture_code}: {e}") from e
 
     def search_by_name(
-        self, name: str, prefecture_code: Optional[str] = None, limit: int = 100
+        self,
+        name: str,
+        prefecture_code: Optional[str] = None,
+        limit: int = 100,
+        prefix: bool = False,
     ) -> list[Shop]:
         """
         店名で検索
 
         Args:
-            name: 店名（部分一致）
+            name: 店名（部分一致、prefix=Trueの場合は前方一致）
             prefecture_code: 都道府県コード（Noneの場合は全国検索）
             limit: 取得件数の上限
+            prefix: 前方一致検索を行うか（サーバー側で絞り込み）
 
         Returns:
             list[Shop]: 店舗オブジェクトのリスト
 
         Note:
-            Firestoreの制限により、完全な部分一致検索はクライアント側でフィルタリング
+            前方一致はname_lowerフィールドの範囲クエリでサーバー側で絞り込む
+            （firestore.indexes.jsonの複合インデックスが必要）。
+            Firestoreの制限により、部分一致検索はクライアント側でフィルタリング
         """
         try:
-            filters = [("is_active", "==", True)]
+            filters: list[tuple[str, str, Any]] = [("is_active", "==", True)]
 
             if prefecture_code:
                 filters.append(("prefecture_code", "==", prefecture_code))
 
-            # search_termsフィールドを使用した検索
-            # （完全一致のみ、部分一致は後でクライアント側でフィルタリング）
-            docs = self.client.query_documents(self.COLLECTION_NAME, filters=filters)
+            name_lower = name.lower()
+
+            if prefix:
+                # name_lowerの範囲クエリで前方一致（\uf8ffはUnicodeの私用領域の末尾）
+                filters.append(("name_lower", ">=", name_lower))
+                filters.append(("name_lower", "<=", name_lower + "\uf8ff"))
+                docs = self.client.query_documents(
+                    self.COLLECTION_NAME, filters=filters, limit=limit
+                )
+                shops = [Shop.from_firestore_dict(doc) for doc in docs]
 
-            # クライアント側で店名による部分一致フィルタリング
-            shops = []
-            for doc in docs:
-                shop = Shop.from_firestore_dict(doc)
-                if name.lower() in shop.name.lower():
-                    shops.append(shop)
-                    if len(shops) >= limit:
-                        break
+                logger.info(f"Found {len(shops)} shops with name prefix '{name}'")
+
+                return shops
+
+            # 部分一致はクライアント側で判定するため、まずは店舗IDと店名のみを取得
+            docs = self.client.query_documents(
+                self.COLLECTION_NAME, filters=filters, projection=["shop_id", "name"]
+            )
+            matched_ids = [
+                doc["shop_id"]
+                for doc in docs
+                if doc.get("shop_id") and name_lower in (doc.get("name") or "").lower()
+            ][:limit]
+
+            # 一致した店舗のみドキュメント全体を取得（検索結果の順序を維持）
+            found = self.client.batch_get_documents(self.COLLECTION_NAME, matched_ids)
+            shops = [
+                Shop.from_firestore_dict(found[shop_id])
+                for shop_id in matched_ids
+                if shop_id in found
+            ]
 
             logger.info(f"Found {len(shops)} shops matching name '{name}'")
 
@@ -248,7 +270,7 @@ class ShopRepository:
             shop_id: 店舗ID
         """
         try:
-            updates = {"is_active": False, "updated_at": datetime.now()}
+            updates = {"is_active": False, "updated_at": batch_now_jst()}
             self.client.update_document(self.COLLECTION_NAME, shop_id, updates)
             logger.info(f"Shop deactivated: {shop_id}")
 
@@ -282,11 +304,12 @@ class ShopRepository:
             longitude: 経度
         """
         try:
+            now = batch_now_jst()
             updates = {
                 "latitude": latitude,
                 "longitude": longitude,
-                "geocoded_at": datetime.now(),
-                "updated_at": datetime.now(),
+                "geocoded_at": now,
+                "updated_at": now,
             }
             self.client.update_document(self.COLLECTION_NAME, shop_id, updates)
             logger.info(f"Geocoding updated for shop {shop_id}: ({latitude}, {longitude})")
@@ -329,15 +352,12 @@ class ShopRepository:
         Returns:
             set[str]: 既存の店舗IDのセット
         """
-        existing_ids = set()
-
         try:
-            for shop_id in shop_ids:
-                doc = self.client.get_document(self.COLLECTION_NAME, shop_id)
-                if doc:
-                    existing_ids.add(shop_id)
-
-            return existing_ids
+            # 存在確認のみなので、ドキュメント本体は取得しない
+            docs = self.client.batch_get_documents(
+                self.COLLECTION_NAME, shop_ids, field_paths=["__name__"]
+            )
+            return set(docs)
 
         except Exception as e:
             logger.warning(f"Failed to get existing shop IDs: {e}")
@@ -1,8 +1,9 @@
 """アプリケーション設定（Pydantic Settings）"""
 
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -45,6 +46,10 @@ class Settings(BaseSettings):
         default=None,
         description="Firestoreエミュレータのホスト（例: localhost:8080）。設定された場合はエミュレータに接続",
     )
+    firestore_client_pool_size: int = Field(
+        default=1,
+        description="Firestoreクライアントのプール数（2以上で複数チャネルにラウンドロビン）",
+    )
     firestore_shops_collection: str = Field(
         default="shops",
         description="店舗コレクション名",
@@ -139,23 +144,57 @@ class Settings(BaseSettings):
         default=False,
         description="Cloud Loggingを有効にするか",
     )
+    log_json: bool = Field(
+        default=False,
+        description="コンソールログをJSON形式（構造化ログ）で出力するか",
+    )
 
     # Cloud Run
     port: int = Field(
         default=8080,
         description="HTTPサーバーのポート番号",
     )
+    workers: int = Field(
+        default=1,
+        description="uvicornのワーカープロセス数（Cloud Runでは1を推奨）",
+    )
+    max_parallel_scrapes: int = Field(
+        default=2,
+        description="1プロセス内で同時に実行するスクレイピングタスク数の上限",
+    )
+
+    # 派生値（初期化時に1回だけ計算）
+    _target_prefecture_codes: list[str] = PrivateAttr(default_factory=list)
+    _environment_lower: str = PrivateAttr(default="")
+
+    def model_post_init(self, __context: Any) -> None:
+        """初期化後に派生値を計算"""
+        self._target_prefecture_codes = [
+            code.strip() for code in self.target_prefectures.split(",")
+        ]
+        self._environment_lower = self.environment.lower()
 
     def get_target_prefecture_codes(self) -> list[str]:
         """対象都道府県コードのリストを取得"""
-        return [code.strip() for code in self.target_prefectures.split(",")]
+        return self._target_prefecture_codes
 
     @property
     def is_production(self) -> bool:
         """本番環境かどうか"""
-        return self.environment.lower() == "production"
+        return self._environment_lower == "production"
 
     @property
     def is_development(self) -> bool:
         """開発環境かどうか"""
-        return self.environment.lower() == "development"
+        return self._environment_lower == "development"
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    アプリケーション設定を取得（プロセス内で1回だけ読み込み）
+
+    Returns:
+        Settings: アプリケーション設定
+    """
+    return Settings()
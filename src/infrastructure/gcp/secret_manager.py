@@ -1,5 +1,6 @@
 """GCP Secret Manager連携"""
 
+import time
 from typing import Optional
 
 from google.cloud import secretmanager
@@ -9,18 +10,26 @@ from ...shared.logging.config import get_logger
 
 logger = get_logger(__name__)
 
+# "latest" バージョンのキャッシュ有効期間（秒）。固定バージョンは無期限にキャッシュ
+LATEST_SECRET_TTL_SECONDS = 300.0
+
 
 class SecretManagerClient:
     """Secret Managerクライアント"""
 
-    def __init__(self, project_id: str):
+    def __init__(self, project_id: str, latest_ttl: float = LATEST_SECRET_TTL_SECONDS):
         """
         Args:
             project_id: GCPプロジェクトID
+            latest_ttl: "latest" バージョンのキャッシュ有効期間（秒）
         """
         self.project_id = project_id
+        self.latest_ttl = latest_ttl
         self.client = secretmanager.SecretManagerServiceClient()
 
+        # (secret_name, version) → (取得時刻, 値)
+        self._cache: dict[tuple[str, str], tuple[float, str]] = {}
+
     def get_secret(self, secret_name: str, version: str = "latest") -> str:
         """
         シークレットの値を取得
@@ -35,12 +44,20 @@ class SecretManagerClient:
         Raises:
             ConfigurationError: シークレット取得失敗時
         """
+        key = (secret_name, version)
+        cached = self._cache.get(key)
+        if cached is not None:
+            fetched_at, cached_value = cached
+            if version != "latest" or time.monotonic() - fetched_at < self.latest_ttl:
+                return cached_value
+
         try:
             name = f"projects/{self.project_id}/secrets/{secret_name}/versions/{version}"
             logger.debug(f"Fetching secret: {name}")
 
             response = self.client.access_secret_version(request={"name": name})
             secret_value = response.payload.data.decode("UTF-8")
+            self._cache[key] = (time.monotonic(), secret_value)
 
             logger.info(f"Successfully fetched secret: {secret_name}")
             return secret_value
@@ -1,17 +1,20 @@
 """Cloud Run用HTTPサーバー（FastAPI）"""
 
+import asyncio
 import os
-from typing import Any
+import threading
+from typing import Any, Callable
 
-from fastapi import BackgroundTasks, FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 
 from .features.batch.orchestrator import BatchOrchestrator
-from .infrastructure.config.settings import Settings
+from .infrastructure.config.settings import get_settings
+from .shared.http.client import HTTPClient
 from .shared.logging.config import get_logger, setup_logging
 
 # 設定を読み込み
-settings = Settings()
+settings = get_settings()
 
 # ローカル開発環境でエミュレータを使用する場合、環境変数を設定
 # google-cloud-firestoreライブラリがこの環境変数を参照するため
@@ -19,7 +22,7 @@ if settings.firestore_emulator_host:
     os.environ["FIRESTORE_EMULATOR_HOST"] = settings.firestore_emulator_host
 
 # ロギングを設定
-setup_logging(level=settings.log_level)
+setup_logging(level=settings.log_level, json_format=settings.log_json)
 logger = get_logger(__name__)
 
 # FastAPIアプリケーションを作成
@@ -27,6 +30,27 @@ app = FastAPI(
     title="子育て支援パスポートスクレイピングサービス",
     description="全国の子育て支援パスポート加盟店情報をスクレイピングし、Firestoreに保存するバッチサービス",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
+
+# スクレイピングタスクの同時実行数を制限するセマフォ
+SCRAPE_SEM = asyncio.Semaphore(settings.max_parallel_scrapes)
+
+# 実行中のタスク（GCで破棄されないよう参照を保持）
+_running_tasks: set[asyncio.Task] = set()
+
+# オーケストレーターの遅延作成用ロック
+_orchestrator_lock = threading.Lock()
+
+# 固定内容のレスポンス（シリアライズ済みのものを使い回す）
+_HEALTH_RESPONSE = ORJSONResponse(content={"status": "healthy"})
+_ROOT_RESPONSE = ORJSONResponse(
+    content={
+        "service": "子育て支援パスポートスクレイピングサービス",
+        "version": "1.0.0",
+        "status": "running",
+        "environment": settings.environment,
+    }
 )
 
 
@@ -37,40 +61,75 @@ async def startup_event() -> None:
     logger.info(f"Environment: {settings.environment}")
     logger.info(f"Project: {settings.project_name}")
 
+    # 対象都道府県コードを起動時に解決
+    app.state.target_codes = tuple(settings.get_target_prefecture_codes())
+
+    # HTTPクライアントをプロセス内で共有（TCP/TLS接続をリクエスト間で再利用）
+    app.state.http_client = HTTPClient(
+        timeout=settings.scraping_timeout,
+        max_retries=settings.scraping_retry,
+        user_agent=settings.scraping_user_agent,
+    )
+
+    # オーケストレーターを起動時に1回だけ作成（失敗時は最初のタスク実行時に再試行）
+    app.state.orchestrator = None
+    try:
+        app.state.orchestrator = BatchOrchestrator(settings, http_client=app.state.http_client)
+    except Exception as e:
+        logger.error(f"Failed to initialize BatchOrchestrator: {e}", exc_info=True)
+
 
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
     """シャットダウン時の処理"""
     logger.info("Application shutting down")
+    app.state.http_client.close()
 
 
-@app.get("/")
-async def root() -> dict[str, Any]:
+@app.get("/", response_model=None)
+async def root() -> ORJSONResponse:
     """ルートエンドポイント"""
-    return {
-        "service": "子育て支援パスポートスクレイピングサービス",
-        "version": "1.0.0",
-        "status": "running",
-        "environment": settings.environment,
-    }
+    return _ROOT_RESPONSE
 
 
-@app.get("/health")
-async def health() -> dict[str, str]:
+@app.get("/health", response_model=None)
+async def health() -> ORJSONResponse:
     """ヘルスチェックエンドポイント"""
-    return {"status": "healthy"}
+    return _HEALTH_RESPONSE
 
 
-@app.post("/scrape/{prefecture_code}")
-async def scrape_prefecture(
-    prefecture_code: str, background_tasks: BackgroundTasks
-) -> dict[str, Any]:
+async def _dispatch(task: Callable[..., None], *args: Any) -> None:
+    """
+    同期タスクをセマフォの範囲内で別スレッド実行
+
+    Args:
+        task: 実行する同期関数
+        *args: タスクの引数
+    """
+    async with SCRAPE_SEM:
+        await asyncio.to_thread(task, *args)
+
+
+def _start_background(task: Callable[..., None], *args: Any) -> None:
+    """
+    同期タスクをバックグラウンドで開始
+
+    Args:
+        task: 実行する同期関数
+        *args: タスクの引数
+    """
+    background = asyncio.create_task(_dispatch(task, *args))
+    _running_tasks.add(background)
+    background.add_done_callback(_running_tasks.discard)
+
+
+@app.post("/scrape/{prefecture_code}", response_model=None)
+async def scrape_prefecture(prefecture_code: str) -> dict[str, Any]:
     """
     指定された都道府県のスクレイピングを実行
 
     Args:
         prefecture_code: 都道府県コード（例: 08）
-        background_tasks: バックグラウンドタスク
 
     Returns:
         dict[str, Any]: レスポンス
@@ -79,7 +138,7 @@ async def scrape_prefecture(
         logger.info(f"Received scraping request for prefecture: {prefecture_code}")
 
         # バックグラウンドタスクとしてスクレイピングを実行
-        background_tasks.add_task(run_scraping_task, prefecture_code)
+        _start_background(run_scraping_task, prefecture_code)
 
         return {
             "message": f"Scraping started for prefecture {prefecture_code}",
@@ -92,14 +151,11 @@ async def scrape_prefecture(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/scrape")
-async def scrape_all_prefectures(background_tasks: BackgroundTasks) -> dict[str, Any]:
+@app.post("/scrape", response_model=None)
+async def scrape_all_prefectures() -> dict[str, Any]:
     """
     設定で指定された全都道府県のスクレイピングを実行
 
-    Args:
-        background_tasks: バックグラウンドタスク
-
     Returns:
         dict[str, Any]: レスポンス
     """
@@ -107,13 +163,11 @@ async def scrape_all_prefectures(background_tasks: BackgroundTasks) -> dict[str,
         logger.info("Received scraping request for all target prefectures")
 
         # バックグラウンドタスクとしてスクレイピングを実行
-        background_tasks.add_task(run_all_scraping_task)
-
-        target_codes = settings.get_target_prefecture_codes()
+        _start_background(run_all_scraping_task)
 
         return {
             "message": "Scraping started for all target prefectures",
-            "target_prefectures": target_codes,
+            "target_prefectures": app.state.target_codes,
             "status": "started",
         }
 
@@ -123,15 +177,28 @@ async def scrape_all_prefectures(background_tasks: BackgroundTasks) -> dict[str,
 
 
 @app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def global_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """グローバル例外ハンドラー"""
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"message": "Internal server error", "detail": str(exc)},
     )
 
 
+def _get_orchestrator() -> BatchOrchestrator:
+    """
+    共有オーケストレーターを取得（未作成の場合は作成）
+
+    Returns:
+        BatchOrchestrator: オーケストレーター
+    """
+    with _orchestrator_lock:
+        if app.state.orchestrator is None:
+            app.state.orchestrator = BatchOrchestrator(settings, http_client=app.state.http_client)
+        return app.state.orchestrator
+
+
 def run_scraping_task(prefecture_code: str) -> None:
     """
     スクレイピングタスクを実行（同期関数）
@@ -142,8 +209,8 @@ def run_scraping_task(prefecture_code: str) -> None:
     try:
         logger.info(f"Starting scraping task for prefecture: {prefecture_code}")
 
-        # オーケストレーターを作成
-        orchestrator = BatchOrchestrator(settings)
+        # 起動時に作成したオーケストレーターを使用
+        orchestrator = _get_orchestrator()
 
         # スクレイピングを実行
         orchestrator.run_prefecture_scraping(prefecture_code)
@@ -164,8 +231,8 @@ def run_all_scraping_task() -> None:
     try:
         logger.info("Starting scraping task for all target prefectures")
 
-        # オーケストレーターを作成
-        orchestrator = BatchOrchestrator(settings)
+        # 起動時に作成したオーケストレーターを使用
+        orchestrator = _get_orchestrator()
 
         # スクレイピングを実行
         orchestrator.run_all_target_prefectures()
@@ -179,9 +246,12 @@ def run_all_scraping_task() -> None:
 if __name__ == "__main__":
     import uvicorn
 
+    # ワーカーを複数起動する場合はインポート文字列での指定が必要
+    # イベントループ/HTTPパーサーはuvicornの自動選択に任せる（uvloop/httptoolsがあれば使用）
     uvicorn.run(
-        app,
+        "src.server:app",
         host="0.0.0.0",
         port=settings.port,
+        workers=settings.workers,
         log_level=settings.log_level.lower(),
     )
@@ -13,6 +13,12 @@ class HTTPError(ScraperError):
     pass
 
 
+class CircuitOpenError(HTTPError):
+    """サーキットブレーカーによりホストへのリクエストが遮断されている"""
+
+    pass
+
+
 class ParsingError(ScraperError):
     """HTML解析エラー"""
 
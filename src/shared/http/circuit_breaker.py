@@ -0,0 +1,119 @@
+"""サーキットブレーカー（ホスト単位の障害遮断）"""
+
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlparse
+
+from ..exceptions.errors import CircuitOpenError
+from ..logging.config import get_logger
+
+logger = get_logger(__name__)
+
+
+class CircuitBreaker:
+    """
+    ホストごとのサーキットブレーカー
+
+    同一ホストへのリクエストが連続して失敗した場合、一定時間そのホストへの
+    リクエストを即座に失敗させる。応答しないサイトに対して
+    「リトライ回数 × タイムアウト」を店舗ごとに費やすことを防ぐ。
+
+    状態遷移:
+    - closed: 通常状態（連続失敗数をカウント）
+    - open: 遮断状態（reset_timeout経過まで即座に失敗）
+    - half-open: reset_timeout経過後、試行リクエストを1件だけ許可
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0) -> None:
+        """
+        Args:
+            failure_threshold: 遮断するまでの連続失敗回数
+            reset_timeout: 遮断後、試行リクエストを許可するまでの秒数
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._lock = threading.Lock()
+        self._failures: dict[str, int] = {}
+        self._opened_at: dict[str, float] = {}
+        self._trial_in_flight: set[str] = set()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """URLからホスト名を取得"""
+        return urlparse(url).netloc
+
+    def before_request(self, url: str) -> None:
+        """
+        リクエスト前の確認
+
+        Args:
+            url: リクエストURL
+
+        Raises:
+            CircuitOpenError: ホストが遮断中の場合
+        """
+        host = self.host_of(url)
+        with self._lock:
+            opened_at: Optional[float] = self._opened_at.get(host)
+            if opened_at is None:
+                return
+
+            # 遮断時間が経過していれば試行リクエストを1件だけ通す
+            if time.monotonic() - opened_at >= self.reset_timeout and host not in (
+                self._trial_in_flight
+            ):
+                self._trial_in_flight.add(host)
+                return
+
+        raise CircuitOpenError(f"Circuit open for {host}: skipping request to {url}")
+
+    def release_trial(self, url: str) -> None:
+        """
+        試行リクエストの枠を解放（成功・失敗を記録せずに終了した場合用）
+
+        遮断状態は維持されるため、次のリクエストが改めて試行リクエストになる。
+        record_success() / record_failure() の後に呼んでも何もしない。
+
+        Args:
+            url: リクエストURL
+        """
+        host = self.host_of(url)
+        with self._lock:
+            self._trial_in_flight.discard(host)
+
+    def record_success(self, url: str) -> None:
+        """
+        リクエスト成功を記録（遮断を解除）
+
+        Args:
+            url: リクエストURL
+        """
+        host = self.host_of(url)
+        with self._lock:
+            self._failures.pop(host, None)
+            self._trial_in_flight.discard(host)
+            if self._opened_at.pop(host, None) is not None:
+                logger.info(f"Circuit closed for {host}")
+
+    def record_failure(self, url: str) -> None:
+        """
+        リクエスト失敗を記録（閾値に達したら遮断）
+
+        Args:
+            url: リクエストURL
+        """
+        host = self.host_of(url)
+        with self._lock:
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            was_trial = host in self._trial_in_flight
+            self._trial_in_flight.discard(host)
+
+            if was_trial or failures >= self.failure_threshold:
+                self._opened_at[host] = time.monotonic()
+                logger.warning(
+                    f"Circuit opened for {host} after {failures} consecutive failures "
+                    f"(retry after {self.reset_timeout:g}s)"
+                )
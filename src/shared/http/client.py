@@ -4,10 +4,12 @@ from typing import Any, Optional
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 from urllib3.util.retry import Retry
 
 from ..exceptions.errors import HTTPError
 from ..logging.config import get_logger
+from .circuit_breaker import CircuitBreaker
 
 logger = get_logger(__name__)
 
@@ -17,9 +19,10 @@ class HTTPClient:
     リトライ機能付きHTTPクライアント
 
     Features:
-    - 自動リトライ（指数バックオフ）
+    - 自動リトライ（ジッター付き指数バックオフ）
     - タイムアウト設定
     - セッション管理
+    - ホスト単位のサーキットブレーカー
     """
 
     def __init__(
@@ -27,22 +30,42 @@ class HTTPClient:
         timeout: int = 20,
         max_retries: int = 3,
         backoff_factor: float = 0.5,
+        backoff_jitter: float = 0.5,
+        backoff_max: float = 8.0,
         status_forcelist: tuple[int, ...] = (500, 502, 503, 504),
         user_agent: Optional[str] = None,
+        pool_connections: int = 64,
+        pool_maxsize: int = 128,
+        circuit_failure_threshold: int = 5,
+        circuit_reset_timeout: float = 60.0,
     ):
         """
         Args:
             timeout: リクエストタイムアウト（秒）
             max_retries: 最大リトライ回数
             backoff_factor: バックオフ係数
+            backoff_jitter: 待機時間に加えるランダム幅の上限（秒）
+            backoff_max: 1回あたりの最大待機時間（秒）
             status_forcelist: リトライ対象のステータスコード
             user_agent: User-Agentヘッダー
+            pool_connections: 接続プールを保持するホスト数
+            pool_maxsize: ホストごとの最大接続数
+            circuit_failure_threshold: ホストを遮断するまでの連続失敗回数
+            circuit_reset_timeout: 遮断後、再試行を許可するまでの秒数
         """
         self.timeout = timeout
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
+        self.backoff_jitter = backoff_jitter
+        self.backoff_max = backoff_max
         self.status_forcelist = status_forcelist
         self.user_agent = user_agent or ("Mozilla/5.0 (compatible; IIBA-KosodateScraper/1.0)")
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=circuit_failure_threshold,
+            reset_timeout=circuit_reset_timeout,
+        )
 
         self.session = self._create_session()
 
@@ -50,20 +73,34 @@ class HTTPClient:
         """セッションを作成"""
         session = requests.Session()
 
-        # リトライ設定
+        # リトライ設定（同時に失敗したリクエストの再送が集中しないようジッターを加える）
         retry_strategy = Retry(
             total=self.max_retries,
             backoff_factor=self.backoff_factor,
+            backoff_jitter=self.backoff_jitter,
+            backoff_max=self.backoff_max,
             status_forcelist=self.status_forcelist,
             allowed_methods=["HEAD", "GET", "POST", "PUT", "DELETE", "OPTIONS", "TRACE"],
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # 複数の都道府県を並行して処理できるよう接続プールを広げる
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=False,
+            max_retries=retry_strategy,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
-        # デフォルトヘッダー
-        session.headers.update({"User-Agent": self.user_agent})
+        # デフォルトヘッダー（圧縮はurllib3が展開できる形式をすべて受け入れる）
+        session.headers.update(
+            {
+                "User-Agent": self.user_agent,
+                "Accept-Encoding": ACCEPT_ENCODING,
+                "Connection": "keep-alive",
+            }
+        )
 
         return session
 
@@ -73,6 +110,8 @@ class HTTPClient:
         params: Optional[dict[str, Any]] = None,
         headers: Optional[dict[str, str]] = None,
         encoding: Optional[str] = None,
+        stream: bool = False,
+        max_bytes: int = 5_000_000,
     ) -> requests.Response:
         """
         GETリクエスト
@@ -82,20 +121,25 @@ class HTTPClient:
             params: クエリパラメータ
             headers: 追加ヘッダー
             encoding: レスポンスのエンコーディング（Noneの場合は自動検出）
+            stream: ステータス確認後に本文をチャンク単位で読み込むか
+            max_bytes: stream時の本文サイズ上限（バイト、展開後）
 
         Returns:
-            レスポンスオブジェクト
+            レスポンスオブジェクト（stream時も本文は読み込み済み）
 
         Raises:
-            HTTPError: リクエスト失敗時
+            HTTPError: リクエスト失敗時、ホストが遮断中の場合、
+                またはstream時に本文がmax_bytesを超えた場合
         """
+        self.circuit_breaker.before_request(url)
         try:
-            logger.debug(f"GET request to {url}")
+            logger.debug("GET request to %s", url)
             response = self.session.get(
                 url,
                 params=params,
                 headers=headers,
                 timeout=self.timeout,
+                stream=stream,
             )
 
             # エンコーディング設定
@@ -103,12 +147,65 @@ class HTTPClient:
                 response.encoding = encoding
 
             response.raise_for_status()
-            logger.debug(f"GET request successful: {url} (status={response.status_code})")
+            self.circuit_breaker.record_success(url)
+            if stream:
+                self._read_limited(response, max_bytes)
+            logger.debug("GET request successful: %s (status=%s)", url, response.status_code)
             return response
 
         except requests.RequestException as e:
+            self._record_failure(url, e)
             logger.error(f"GET request failed: {url} - {e}")
             raise HTTPError(f"Failed to GET {url}: {e}") from e
+        finally:
+            # 想定外の例外で抜けた場合も試行リクエストの枠を残さない
+            self.circuit_breaker.release_trial(url)
+
+    def _record_failure(self, url: str, error: requests.RequestException) -> None:
+        """
+        リクエスト失敗をサーキットブレーカーに記録
+
+        接続エラー・タイムアウト・リトライ上限到達・5xxのみをホスト障害とみなし、
+        4xxはホストが応答しているため成功として扱う。
+
+        Args:
+            url: リクエストURL
+            error: 発生した例外
+        """
+        response = getattr(error, "response", None)
+        if response is None or response.status_code >= 500:
+            self.circuit_breaker.record_failure(url)
+        else:
+            self.circuit_breaker.record_success(url)
+
+    @staticmethod
+    def _read_limited(response: requests.Response, max_bytes: int) -> None:
+        """
+        ストリーミングレスポンスの本文を上限付きで読み込む
+
+        上限を超えた時点で接続を閉じ、残りはダウンロードしない。
+
+        Args:
+            response: stream=Trueで取得したレスポンス
+            max_bytes: 本文サイズ上限（バイト）
+
+        Raises:
+            HTTPError: 本文がmax_bytesを超えた場合
+        """
+        content_length = response.headers.get("Content-Length")
+        if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+            response.close()
+            raise HTTPError(f"Response too large: {response.url} ({content_length} bytes)")
+
+        buf = bytearray()
+        with response:
+            for chunk in response.iter_content(chunk_size=65536):
+                buf += chunk
+                if len(buf) > max_bytes:
+                    raise HTTPError(f"Response too large: {response.url} (> {max_bytes} bytes)")
+
+        # 読み込んだ本文をセットし、.text / .content で参照できるようにする
+        response._content = bytes(buf)
 
     def post(
         self,
@@ -132,10 +229,11 @@ class HTTPClient:
             レスポンスオブジェクト
 
         Raises:
-            HTTPError: リクエスト失敗時
+            HTTPError: リクエスト失敗時、またはホストが遮断中の場合
         """
+        self.circuit_breaker.before_request(url)
         try:
-            logger.debug(f"POST request to {url}")
+            logger.debug("POST request to %s", url)
             response = self.session.post(
                 url,
                 data=data,
@@ -148,12 +246,17 @@ class HTTPClient:
                 response.encoding = encoding
 
             response.raise_for_status()
-            logger.debug(f"POST request successful: {url} (status={response.status_code})")
+            self.circuit_breaker.record_success(url)
+            logger.debug("POST request successful: %s (status=%s)", url, response.status_code)
             return response
 
         except requests.RequestException as e:
+            self._record_failure(url, e)
             logger.error(f"POST request failed: {url} - {e}")
             raise HTTPError(f"Failed to POST {url}: {e}") from e
+        finally:
+            # 想定外の例外で抜けた場合も試行リクエストの枠を残さない
+            self.circuit_breaker.release_trial(url)
 
     def close(self) -> None:
         """セッションをクローズ"""
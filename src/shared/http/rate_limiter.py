@@ -16,17 +16,22 @@ class RateLimiter:
     ポライトクローリングのために、リクエスト間にランダムな待機時間を設ける
     """
 
+    # 事前生成する待機時間サンプル数（リングバッファのサイズ）
+    JITTER_SAMPLES = 256
+
     def __init__(
         self,
         min_wait: float = 1.0,
         max_wait: float = 2.0,
         requests_per_second: Optional[float] = None,
+        seed: Optional[int] = None,
     ):
         """
         Args:
             min_wait: 最小待機時間（秒）
             max_wait: 最大待機時間（秒）
             requests_per_second: 秒あたりの最大リクエスト数（設定時はmin/max_waitを上書き）
+            seed: 待機時間サンプル生成用の乱数シード（Noneの場合はランダム）
         """
         if requests_per_second:
             # リクエスト/秒から待機時間を計算
@@ -39,11 +44,24 @@ class RateLimiter:
 
         self.last_request_time: Optional[float] = None
 
+        # 待機時間を事前に生成し、リクエストごとに順番に使用
+        rng = random.Random(seed)
+        self._jitter = [
+            rng.uniform(self.min_wait, self.max_wait) for _ in range(self.JITTER_SAMPLES)
+        ]
+        self._jitter_index = 0
+
         logger.debug(
             f"RateLimiter initialized: min_wait={self.min_wait:.2f}s, "
             f"max_wait={self.max_wait:.2f}s"
         )
 
+    def _next_wait(self) -> float:
+        """リングバッファから次の待機時間を取得"""
+        wait_time = self._jitter[self._jitter_index]
+        self._jitter_index = (self._jitter_index + 1) % self.JITTER_SAMPLES
+        return wait_time
+
     def wait(self) -> None:
         """
         適切な待機時間をスリープ
@@ -51,18 +69,17 @@ class RateLimiter:
         前回のリクエストからの経過時間を考慮し、
         必要に応じて追加の待機を行う
         """
-        current_time = time.time()
+        # 時刻計測はシステム時刻の変更に影響されないmonotonicを使用
+        current_time = time.monotonic()
 
         if self.last_request_time is not None:
-            elapsed = current_time - self.last_request_time
-            wait_time = random.uniform(self.min_wait, self.max_wait)
-
-            if elapsed < wait_time:
-                sleep_duration = wait_time - elapsed
-                logger.debug(f"Rate limiting: sleeping for {sleep_duration:.2f}s")
+            sleep_duration = self._next_wait() - (current_time - self.last_request_time)
+            if sleep_duration > 0:
+                logger.debug("Rate limiting: sleeping for %.2fs", sleep_duration)
                 time.sleep(sleep_duration)
+                current_time = time.monotonic()
 
-        self.last_request_time = time.time()
+        self.last_request_time = current_time
 
     def reset(self) -> None:
         """レート制限をリセット"""
@@ -79,5 +96,5 @@ def polite_sleep(min_seconds: float = 1.0, max_seconds: float = 2.0) -> None:
         max_seconds: 最大待機時間（秒）
     """
     sleep_time = random.uniform(min_seconds, max_seconds)
-    logger.debug(f"Polite sleep: {sleep_time:.2f}s")
+    logger.debug("Polite sleep: %.2fs", sleep_time)
     time.sleep(sleep_time)
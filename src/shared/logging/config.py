@@ -2,16 +2,41 @@
 
 import logging
 import sys
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
+
+import orjson
 
 # ロガー設定済みフラグ
 _logger_configured = False
 
 
+class JsonFormatter(logging.Formatter):
+    """
+    Cloud Logging向けの構造化ログ（1行1JSON）フォーマッター
+
+    asctimeの文字列化は行わず、record.createdからタイムスタンプを組み立てる
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """ログレコードをJSON文字列に変換"""
+        seconds = int(record.created)
+        entry: dict[str, Any] = {
+            "severity": record.levelname,
+            "message": record.getMessage(),
+            "timestamp": {"seconds": seconds, "nanos": int((record.created - seconds) * 1e9)},
+            "logger": record.name,
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry).decode()
+
+
 def setup_logging(
     level: str = "INFO",
     enable_cloud_logging: bool = False,
     project_id: Optional[str] = None,
+    json_format: bool = False,
 ) -> None:
     """
     ロギングを設定
@@ -20,6 +45,7 @@ def setup_logging(
         level: ログレベル (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         enable_cloud_logging: Cloud Loggingを有効にするか
         project_id: GCPプロジェクトID (Cloud Logging有効時に必要)
+        json_format: コンソール出力をJSON形式にするか（Cloud Run向け）
     """
     global _logger_configured
 
@@ -29,6 +55,11 @@ def setup_logging(
     # ログレベルの設定
     log_level = getattr(logging, level.upper(), logging.INFO)
 
+    # 使用しないスレッド・プロセス情報の取得をレコードごとに行わない
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     # ルートロガーの設定
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
@@ -37,10 +68,14 @@ def setup_logging(
     root_logger.handlers.clear()
 
     # フォーマッターの設定
-    formatter = logging.Formatter(
-        fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    formatter: logging.Formatter
+    if json_format:
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(
+            fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
 
     # コンソールハンドラーの追加
     console_handler = logging.StreamHandler(sys.stdout)
@@ -64,6 +99,7 @@ def setup_logging(
 
     # サードパーティライブラリのログレベルを調整
     logging.getLogger("urllib3").setLevel(logging.WARNING)
+    logging.getLogger("urllib3.connectionpool").setLevel(logging.ERROR)
     logging.getLogger("google").setLevel(logging.WARNING)
     logging.getLogger("googleapiclient").setLevel(logging.WARNING)
 
@@ -71,6 +107,7 @@ def setup_logging(
     logging.info(f"Logging configured with level: {level}")
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """
     指定名のロガーを取得
@@ -1,11 +1,16 @@
 """日時関連ユーティリティ"""
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
-
-import pytz
+from typing import Iterator, Optional
+from zoneinfo import ZoneInfo
 
 # 日本時間のタイムゾーン
-JST = pytz.timezone("Asia/Tokyo")
+JST = ZoneInfo("Asia/Tokyo")
+
+# freeze_time() で固定された現在時刻（スレッド・タスクごと）
+_frozen_now: ContextVar[Optional[datetime]] = ContextVar("_frozen_now", default=None)
 
 
 def now_jst() -> datetime:
@@ -13,6 +18,36 @@ def now_jst() -> datetime:
     return datetime.now(JST)
 
 
+def batch_now_jst() -> datetime:
+    """
+    バッチ内で共通の現在時刻（日本時間）を取得
+
+    freeze_time() の範囲内では固定された時刻を返し、
+    範囲外では now_jst() と同じ。
+    """
+    frozen = _frozen_now.get()
+    return frozen if frozen is not None else now_jst()
+
+
+@contextmanager
+def freeze_time(at: Optional[datetime] = None) -> Iterator[datetime]:
+    """
+    範囲内の batch_now_jst() を1つの時刻に固定
+
+    Args:
+        at: 固定する時刻（Noneの場合は開始時点の日本時間）
+
+    Yields:
+        固定された時刻
+    """
+    frozen = at or now_jst()
+    token = _frozen_now.set(frozen)
+    try:
+        yield frozen
+    finally:
+        _frozen_now.reset(token)
+
+
 def now_utc() -> datetime:
     """現在のUTC時間を取得"""
     return datetime.now(timezone.utc)
@@ -47,7 +82,7 @@ def to_utc(dt: datetime) -> datetime:
     """
     if dt.tzinfo is None:
         # タイムゾーン情報がない場合はJSTとして扱う
-        dt = JST.localize(dt)
+        dt = dt.replace(tzinfo=JST)
 
     return dt.astimezone(timezone.utc)
 
@@ -3,6 +3,13 @@
 import re
 from typing import Optional
 
+# 正規表現パターン（モジュール読み込み時に1回だけコンパイル）
+WHITESPACE_RE = re.compile(r"\s+")  # 連続する空白（\sは全角スペースU+3000も含む）
+_TAG_RE = re.compile(r"<[^>]+>")
+_PHONE_RE1 = re.compile(r"\d{2,4}[-\(]?\d{2,4}[-\)]?\d{3,4}")  # 一般的なパターン
+_PHONE_RE2 = re.compile(r"\d{10,11}")  # ハイフンなし
+_POSTAL_RE = re.compile(r"\d{3}-?\d{4}")
+
 
 def normalize_text(text: Optional[str]) -> Optional[str]:
     """
@@ -15,11 +22,8 @@ def normalize_text(text: Optional[str]) -> Optional[str]:
     if not text:
         return None
 
-    # 全角スペースを半角に変換
-    text = text.replace("\u3000", " ")
-
-    # 連続する空白を1つに
-    text = re.sub(r"\s+", " ", text)
+    # 連続する空白（全角スペースを含む）を半角スペース1つに
+    text = WHITESPACE_RE.sub(" ", text)
 
     # 前後の空白を除去
     text = text.strip()
@@ -40,13 +44,8 @@ def extract_phone_number(text: str) -> Optional[str]:
         return None
 
     # 電話番号パターン（ハイフンあり・なし）
-    patterns = [
-        r"\d{2,4}[-\(]?\d{2,4}[-\)]?\d{3,4}",  # 一般的なパターン
-        r"\d{10,11}",  # ハイフンなし
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text)
+    for pattern in (_PHONE_RE1, _PHONE_RE2):
+        match = pattern.search(text)
         if match:
             return match.group()
 
@@ -63,7 +62,7 @@ def extract_postal_code(text: str) -> Optional[str]:
         return None
 
     # 郵便番号パターン
-    match = re.search(r"\d{3}-?\d{4}", text)
+    match = _POSTAL_RE.search(text)
     if match:
         postal = match.group()
         # ハイフンがない場合は追加
@@ -98,5 +97,5 @@ def remove_html_tags(text: str) -> str:
         return ""
 
     # HTMLタグを除去
-    clean = re.sub(r"<[^>]+>", "", text)
+    clean = _TAG_RE.sub("", text)
     return normalize_text(clean) or ""
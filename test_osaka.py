@@ -14,9 +14,8 @@ scraper = OsakaScraper(http_client=http_client)
 print(f"Scraper initialized: {scraper.prefecture_name}")
 print(f"Base URL: {scraper.base_url}")
 
-# Test API call directly
-import requests
-response = requests.get("https://api.osaka-pass.jp/shop/list/?GROUP=1&START=0")
+# Test API call via the shared client
+response = http_client.get("https://api.osaka-pass.jp/shop/list/", params={"GROUP": 1, "START": 0})
 data = response.json()
 
 print(f"\nAPI Response:")
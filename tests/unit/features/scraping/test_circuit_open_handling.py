@@ -0,0 +1,61 @@
+"""サーキットブレーカー遮断時のスクレイパー挙動のテスト"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.features.batch.jobs.prefecture_scraping_job import PrefectureScrapingJob
+from src.features.scraping.domain.enums import ScrapingStatus
+from src.features.scraping.scrapers.prefectures.ibaraki import IbarakiScraper
+from src.shared.exceptions.errors import CircuitOpenError, HTTPError
+
+
+@pytest.fixture
+def scraper() -> IbarakiScraper:
+    """HTTPクライアントをモックした茨城県スクレイパー"""
+    scraper = IbarakiScraper(http_client=MagicMock())
+    scraper.session_token = "token"
+    return scraper
+
+
+def test_get_detail_links_reraises_circuit_open(scraper: IbarakiScraper) -> None:
+    """遮断中は空ページ扱いにせず例外を送出する"""
+    scraper.http_client.get.side_effect = CircuitOpenError("open")
+
+    with pytest.raises(CircuitOpenError):
+        scraper.get_detail_links(1)
+
+
+def test_get_detail_links_swallows_http_error(scraper: IbarakiScraper) -> None:
+    """通常のHTTPエラーは従来どおり空リストを返す"""
+    scraper.http_client.get.side_effect = HTTPError("404")
+
+    assert scraper.get_detail_links(1) == []
+
+
+def test_parse_detail_page_reraises_circuit_open(scraper: IbarakiScraper) -> None:
+    """遮断中は店舗をスキップせず例外を送出する"""
+    scraper.http_client.get.side_effect = CircuitOpenError("open")
+
+    with pytest.raises(CircuitOpenError):
+        scraper.parse_detail_page("https://example.com/detail/1")
+
+
+def test_job_fails_and_keeps_progress_when_circuit_opens(scraper: IbarakiScraper) -> None:
+    """遮断時はジョブをFAILEDで終了し、進捗をクリアしない"""
+    scraper._init_session = MagicMock()
+    scraper.http_client.get.side_effect = CircuitOpenError("open")
+    progress_repository = MagicMock()
+    progress_repository.get_progress.return_value = None
+
+    job = PrefectureScrapingJob(
+        scraper=scraper,
+        geocoding_service=None,
+        shop_repository=MagicMock(),
+        history_repository=MagicMock(),
+        progress_repository=progress_repository,
+    )
+    result = job.execute()
+
+    assert result.status == ScrapingStatus.FAILED
+    progress_repository.clear_progress.assert_not_called()
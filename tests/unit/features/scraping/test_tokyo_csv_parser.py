@@ -0,0 +1,63 @@
+"""東京都CSVパーサーのテスト"""
+
+import pytest
+
+from src.features.scraping.parsers.prefectures.tokyo_csv_parser import TokyoCsvParser
+
+COLUMNS = {
+    "shop_id": 0,
+    "name": 1,
+    "city": 2,
+    "address1": 3,
+    "address2": 4,
+    "phone": 5,
+    "genre1": 6,
+    "service_milk": 7,
+    "discount_detail": 8,
+}
+
+
+@pytest.fixture
+def parser() -> TokyoCsvParser:
+    """website等を割り当てていない列マッピングのパーサー"""
+    return TokyoCsvParser("13", "東京都", COLUMNS)
+
+
+def test_parse_row(parser: TokyoCsvParser) -> None:
+    """列インデックスから店舗情報を組み立てる"""
+    row = ["T1", " 店舗 ", "千代田区", "丸の内1-1", "", "03-1234-5678", "飲食", "○", "10%引"]
+
+    shop = parser.parse_row(row)
+
+    assert shop is not None
+    assert shop.shop_id == "13_T1"
+    assert shop.name == "店舗"
+    assert shop.address == "東京都千代田区丸の内1-1"
+    assert shop.phone == "03-1234-5678"
+    assert shop.benefits == "粉ミルクのお湯の提供、詳細: 10%引"
+    assert shop.description == "業種: 飲食"
+
+
+def test_parse_row_unmapped_columns_are_none(parser: TokyoCsvParser) -> None:
+    """列マッピングにない項目はNoneになる"""
+    row = ["T1", "店舗", "千代田区", "丸の内1-1", "", "", "", "", ""]
+
+    shop = parser.parse_row(row)
+
+    assert shop is not None
+    assert shop.website is None
+    assert shop.business_hours is None
+    assert shop.benefits is None
+
+
+@pytest.mark.parametrize("name", ["", "   "])
+def test_parse_row_skips_empty_name(parser: TokyoCsvParser, name: str) -> None:
+    """店舗名が空の行はスキップ"""
+    row = ["T1", name, "千代田区", "丸の内1-1", "", "", "", "", ""]
+
+    assert parser.parse_row(row) is None
+
+
+def test_parse_row_skips_short_row(parser: TokyoCsvParser) -> None:
+    """列数が足りない行はスキップ"""
+    assert parser.parse_row(["T1", "店舗"]) is None
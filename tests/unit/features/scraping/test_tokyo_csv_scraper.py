@@ -0,0 +1,45 @@
+"""東京都CSVスクレイパーのテスト"""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.features.scraping.scrapers.prefectures.tokyo_csv_scraper import TokyoCsvScraper
+from src.shared.utils.datetime_utils import JST, freeze_time
+
+FROZEN_AT = datetime(2024, 4, 1, 9, 0, tzinfo=JST)
+
+
+@pytest.fixture
+def scraper() -> TokyoCsvScraper:
+    """HTTPクライアントをモックした東京都CSVスクレイパー"""
+    return TokyoCsvScraper(http_client=MagicMock())
+
+
+@pytest.fixture
+def rows(scraper: TokyoCsvScraper) -> list[list[str]]:
+    """店舗名と店舗IDのみを埋めたCSV行"""
+    width = max(scraper.column_mapping.values()) + 1
+    rows = []
+    for i in range(6):
+        row = [""] * width
+        row[scraper.column_mapping["shop_id"]] = f"T{i}"
+        row[scraper.column_mapping["name"]] = f"店舗{i}"
+        rows.append(row)
+    return rows
+
+
+@pytest.mark.parametrize("parse_workers", [1, 2])
+def test_iter_shops_uses_frozen_time(
+    scraper: TokyoCsvScraper, rows: list[list[str]], parse_workers: int
+) -> None:
+    """直列・プロセス並列のどちらでもジョブ共通の日時を付与する"""
+    scraper.parse_workers = parse_workers
+
+    with freeze_time(FROZEN_AT):
+        shops = list(scraper._iter_shops(iter(rows)))
+
+    assert [shop.shop_id for shop in shops] == [f"13_T{i}" for i in range(6)]
+    assert {shop.scraped_at for shop in shops} == {FROZEN_AT}
+    assert {shop.updated_at for shop in shops} == {FROZEN_AT}
@@ -0,0 +1,96 @@
+"""進捗リポジトリのテスト"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.features.storage.repositories.progress_repository import (
+    ProgressRepository,
+    _decode_pages,
+    _encode_pages,
+)
+
+
+@pytest.mark.parametrize(
+    "pages",
+    [
+        [0],
+        [1, 2, 3],
+        [7, 8],
+        [0, 7, 8, 15, 16, 23, 24],
+        list(range(1, 65)),
+        # 大阪府は取得済み件数（start_index）をページ番号として記録する
+        [50, 100, 12350, 12400],
+    ],
+)
+def test_encode_decode_round_trip(pages: list[int]) -> None:
+    """エンコードしたビットマップから同じページリストを復元できる"""
+    assert _decode_pages(_encode_pages(pages)) == pages
+
+
+def test_encode_empty_pages() -> None:
+    """空のページリストは空のビットマップになる"""
+    assert _encode_pages([]) == b""
+    assert _decode_pages(b"") == []
+
+
+def test_encode_layout() -> None:
+    """ページpはバイトp>>3のビットp&7に格納される"""
+    assert _encode_pages([0]) == b"\x01"
+    assert _encode_pages([7]) == b"\x80"
+    assert _encode_pages([8]) == b"\x00\x01"
+    assert len(_encode_pages([12400])) == 12400 // 8 + 1
+
+
+def test_decode_sorts_and_deduplicates() -> None:
+    """重複・順不同のページも昇順の一意なリストになる"""
+    assert _decode_pages(_encode_pages([9, 3, 9, 1])) == [1, 3, 9]
+
+
+def make_repository(stored: dict | None) -> ProgressRepository:
+    """指定したドキュメントを返すFirestoreクライアントでリポジトリを作成"""
+    snapshot = MagicMock(exists=stored is not None)
+    snapshot.to_dict.return_value = stored
+    client = MagicMock()
+    client.get_collection.return_value.document.return_value.get.return_value = snapshot
+    return ProgressRepository(client)
+
+
+def test_get_progress_decodes_bitmap() -> None:
+    """ビットマップ形式の進捗をページリストに展開する"""
+    repository = make_repository(
+        {"completed_pages_bitmap": _encode_pages([1, 2, 5]), "total_shops_saved": 30}
+    )
+
+    progress = repository.get_progress("08")
+
+    assert progress is not None
+    assert progress["completed_pages"] == [1, 2, 5]
+    assert progress["total_shops_saved"] == 30
+
+
+def test_get_progress_merges_legacy_array() -> None:
+    """旧形式の completed_pages 配列が残っていればビットマップと統合する"""
+    repository = make_repository(
+        {"completed_pages_bitmap": _encode_pages([1, 2]), "completed_pages": [2, 3, 10]}
+    )
+
+    progress = repository.get_progress("08")
+
+    assert progress is not None
+    assert progress["completed_pages"] == [1, 2, 3, 10]
+
+
+def test_get_progress_legacy_array_only() -> None:
+    """ビットマップ導入前のドキュメントは配列をそのまま使用する"""
+    repository = make_repository({"completed_pages": [1, 2, 3]})
+
+    progress = repository.get_progress("08")
+
+    assert progress is not None
+    assert progress["completed_pages"] == [1, 2, 3]
+
+
+def test_get_progress_missing() -> None:
+    """進捗がない場合はNone"""
+    assert make_repository(None).get_progress("08") is None
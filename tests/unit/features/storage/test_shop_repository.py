@@ -0,0 +1,56 @@
+"""店舗リポジトリのテスト"""
+
+from unittest.mock import MagicMock
+
+from src.features.storage.repositories.shop_repository import ShopRepository
+
+
+def shop_doc(shop_id: str, name: str) -> dict:
+    """Firestoreに保存された店舗ドキュメント"""
+    return {
+        "shop_id": shop_id,
+        "prefecture_code": "13",
+        "prefecture_name": "東京都",
+        "name": name,
+        "is_active": True,
+    }
+
+
+def test_search_by_name_fetches_only_matches() -> None:
+    """部分一致検索は店名のみを取得し、一致した店舗だけ全体を取得する"""
+    client = MagicMock()
+    client.query_documents.return_value = [
+        {"shop_id": "13_1", "name": "さくらカフェ"},
+        {"shop_id": "13_2", "name": "ひまわり書店"},
+        {"shop_id": "13_3", "name": "Cafe Sakura"},
+        {"shop_id": "13_4", "name": "カフェ もみじ"},
+    ]
+    client.batch_get_documents.return_value = {
+        "13_4": shop_doc("13_4", "カフェ もみじ"),
+        "13_1": shop_doc("13_1", "さくらカフェ"),
+    }
+    repository = ShopRepository(client)
+
+    shops = repository.search_by_name("カフェ", prefecture_code="13", limit=10)
+
+    assert client.query_documents.call_args.kwargs["projection"] == ["shop_id", "name"]
+    client.batch_get_documents.assert_called_once_with(
+        ShopRepository.COLLECTION_NAME, ["13_1", "13_4"]
+    )
+    assert [shop.shop_id for shop in shops] == ["13_1", "13_4"]
+
+
+def test_search_by_name_respects_limit() -> None:
+    """一致件数がlimitを超える場合は先頭からlimit件のみ取得する"""
+    client = MagicMock()
+    client.query_documents.return_value = [
+        {"shop_id": f"13_{i}", "name": f"カフェ{i}"} for i in range(5)
+    ]
+    client.batch_get_documents.return_value = {}
+    repository = ShopRepository(client)
+
+    repository.search_by_name("カフェ", limit=2)
+
+    client.batch_get_documents.assert_called_once_with(
+        ShopRepository.COLLECTION_NAME, ["13_0", "13_1"]
+    )
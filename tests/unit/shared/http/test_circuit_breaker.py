@@ -0,0 +1,150 @@
+"""サーキットブレーカーのテスト"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.shared.exceptions.errors import CircuitOpenError, HTTPError
+from src.shared.http import circuit_breaker as circuit_breaker_module
+from src.shared.http.circuit_breaker import CircuitBreaker
+from src.shared.http.client import HTTPClient
+
+URL = "https://example.com/shops?page=1"
+OTHER_URL = "https://other.example.com/"
+
+
+class FakeClock:
+    """time.monotonic の代わりに使う手動で進める時計"""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """サーキットブレーカーの時刻を固定"""
+    fake = FakeClock()
+    monkeypatch.setattr(circuit_breaker_module.time, "monotonic", fake)
+    return fake
+
+
+@pytest.fixture
+def breaker(clock: FakeClock) -> CircuitBreaker:
+    """閾値3回・遮断10秒のサーキットブレーカー"""
+    return CircuitBreaker(failure_threshold=3, reset_timeout=10.0)
+
+
+def trip(breaker: CircuitBreaker, url: str = URL) -> None:
+    """閾値回数の失敗を記録して遮断状態にする"""
+    for _ in range(breaker.failure_threshold):
+        breaker.before_request(url)
+        breaker.record_failure(url)
+
+
+def test_circuit_open_error_is_http_error() -> None:
+    """CircuitOpenErrorはHTTPErrorのサブクラス"""
+    assert issubclass(CircuitOpenError, HTTPError)
+
+
+def test_closed_allows_requests_below_threshold(breaker: CircuitBreaker) -> None:
+    """閾値未満の失敗では遮断しない"""
+    for _ in range(breaker.failure_threshold - 1):
+        breaker.before_request(URL)
+        breaker.record_failure(URL)
+
+    breaker.before_request(URL)
+
+
+def test_success_resets_failure_count(breaker: CircuitBreaker) -> None:
+    """成功すると連続失敗数がリセットされる"""
+    for _ in range(breaker.failure_threshold - 1):
+        breaker.record_failure(URL)
+    breaker.record_success(URL)
+    breaker.record_failure(URL)
+
+    breaker.before_request(URL)
+
+
+def test_opens_after_threshold(breaker: CircuitBreaker) -> None:
+    """連続失敗が閾値に達すると遮断する"""
+    trip(breaker)
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(URL)
+
+
+def test_open_circuit_is_per_host(breaker: CircuitBreaker) -> None:
+    """遮断はホスト単位"""
+    trip(breaker)
+
+    breaker.before_request(OTHER_URL)
+
+
+def test_half_open_allows_single_trial(breaker: CircuitBreaker, clock: FakeClock) -> None:
+    """遮断時間経過後は試行リクエストを1件だけ通す"""
+    trip(breaker)
+    clock.now += breaker.reset_timeout
+
+    breaker.before_request(URL)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(URL)
+
+
+def test_trial_success_closes_circuit(breaker: CircuitBreaker, clock: FakeClock) -> None:
+    """試行リクエストが成功すると遮断を解除する"""
+    trip(breaker)
+    clock.now += breaker.reset_timeout
+
+    breaker.before_request(URL)
+    breaker.record_success(URL)
+
+    breaker.before_request(URL)
+    breaker.before_request(URL)
+
+
+def test_trial_failure_reopens_circuit(breaker: CircuitBreaker, clock: FakeClock) -> None:
+    """試行リクエストが失敗すると再び遮断する"""
+    trip(breaker)
+    clock.now += breaker.reset_timeout
+
+    breaker.before_request(URL)
+    breaker.record_failure(URL)
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(URL)
+
+    clock.now += breaker.reset_timeout
+    breaker.before_request(URL)
+
+
+def test_release_trial_keeps_circuit_open(breaker: CircuitBreaker, clock: FakeClock) -> None:
+    """試行枠を解放しても遮断は解除されず、次のリクエストが試行になる"""
+    trip(breaker)
+    clock.now += breaker.reset_timeout
+
+    breaker.before_request(URL)
+    breaker.release_trial(URL)
+
+    breaker.before_request(URL)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(URL)
+
+
+def test_client_releases_trial_on_unexpected_error(clock: FakeClock) -> None:
+    """想定外の例外で抜けても試行枠が残らない"""
+    client = HTTPClient(circuit_failure_threshold=1, circuit_reset_timeout=10.0)
+    client.session = MagicMock()
+    client.circuit_breaker.record_failure(URL)
+    clock.now += 10.0
+
+    client.session.get.side_effect = ValueError("unexpected")
+    with pytest.raises(ValueError):
+        client.get(URL)
+
+    client.session.get.side_effect = None
+    client.session.get.return_value = MagicMock(status_code=200)
+    client.get(URL)
+    client.get(URL)